@@ -0,0 +1,158 @@
+"""Compare ffmpeg and in-process decoding of WAV announcement media.
+
+Writes test WAV files in a few common formats, then converts each one to
+mono 16-bit PCM at the satellite sample rate using both ffmpeg (as
+announcements did previously) and the NumPy decoder.  Reports wall clock
+time to first audio, total time and CPU time for each path.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_announce_decode.py [--seconds 10] [--runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import resource
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.vaca.audio import async_iter_wav_pcm
+
+TARGET_RATE = 22050
+CHUNK_BYTES = 2048
+FORMATS = (
+    (22050, 2, 1),
+    (44100, 2, 2),
+    (48000, 2, 1),
+    (16000, 2, 1),
+)
+
+
+class _Executor:
+    """Run executor jobs inline, so CPU time is counted for this process."""
+
+    async def async_add_executor_job(self, target, *args):
+        return target(*args)
+
+
+def _write_wav(path: str, rate: int, width: int, channels: int, seconds: float) -> None:
+    """Write a test tone."""
+    t = np.arange(int(rate * seconds)) / rate
+    tone = np.sin(2 * np.pi * 440 * t) * 0.5 * (2 ** (8 * width - 1) - 1)
+    samples = np.repeat(tone, channels).astype(f"<i{width}")
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setframerate(rate)
+        wav_file.setsampwidth(width)
+        wav_file.setnchannels(channels)
+        wav_file.writeframes(samples.tobytes())
+
+
+async def _run_ffmpeg(binary: str, path: str) -> tuple[float, float, float]:
+    """Convert a file with ffmpeg and return first audio, total and CPU time."""
+    usage_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = time.perf_counter()
+    first = None
+    proc = await asyncio.create_subprocess_exec(
+        binary,
+        "-i",
+        path,
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-ar",
+        str(TARGET_RATE),
+        "-nostats",
+        "pipe:",
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    assert proc.stdout is not None
+    while await proc.stdout.read(CHUNK_BYTES):
+        if first is None:
+            first = time.perf_counter() - start
+    await proc.wait()
+    total = time.perf_counter() - start
+    usage_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (usage_after.ru_utime - usage_before.ru_utime) + (
+        usage_after.ru_stime - usage_before.ru_stime
+    )
+    return first or total, total, cpu
+
+
+def _read_file(path: str) -> bytes:
+    """Read a whole file."""
+    with open(path, "rb") as file:
+        return file.read()
+
+
+async def _run_numpy(path: str) -> tuple[float, float, float]:
+    """Convert a file in process and return first audio, total and CPU time."""
+    # Read outside the event loop and before timing, like media already
+    # arriving over the network
+    data = await asyncio.to_thread(_read_file, path)
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    first = None
+
+    async def _read():
+        for offset in range(0, len(data), 16384):
+            yield data[offset : offset + 16384]
+
+    async for _ in async_iter_wav_pcm(_Executor(), _read(), TARGET_RATE):
+        if first is None:
+            first = time.perf_counter() - start
+    total = time.perf_counter() - start
+    return first or total, total, time.process_time() - cpu_start
+
+
+def _summary(results: list[tuple[float, float, float]]) -> str:
+    """Format median timings in milliseconds."""
+    first, total, cpu = zip(*results, strict=True)
+    return (
+        f"first {statistics.median(first) * 1000:7.2f}ms  "
+        f"total {statistics.median(total) * 1000:7.2f}ms  "
+        f"cpu {statistics.median(cpu) * 1000:7.2f}ms"
+    )
+
+
+async def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    ffmpeg_binary = shutil.which("ffmpeg")
+    if ffmpeg_binary is None:
+        print("ffmpeg not found, only timing in-process decoding")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rate, width, channels in FORMATS:
+            path = os.path.join(tmp_dir, f"{rate}_{width}_{channels}.wav")
+            _write_wav(path, rate, width, channels, args.seconds)
+            print(f"{rate}Hz {width * 8}-bit {channels}ch, {args.seconds}s:")
+
+            if ffmpeg_binary is not None:
+                results = [
+                    await _run_ffmpeg(ffmpeg_binary, path) for _ in range(args.runs)
+                ]
+                print(f"  ffmpeg  {_summary(results)}")
+
+            results = [await _run_numpy(path) for _ in range(args.runs)]
+            print(f"  numpy   {_summary(results)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
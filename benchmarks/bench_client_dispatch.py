@@ -0,0 +1,175 @@
+"""Measure per-event callback overhead of the satellite TCP client.
+
+Compares the previous client, which awaited the before send, after send and
+receive callbacks for every event, with the current client, which looks up
+callbacks by event type.  Audio chunks are written to a writer that
+discards data, and read back from a stream reader fed with the same bytes,
+so the difference is the cost of the callback dispatch.
+
+Run from the repository root:
+
+    python benchmarks/bench_client_dispatch.py [--events 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import time
+
+from wyoming.audio import AudioChunk
+from wyoming.client import AsyncTcpClient
+from wyoming.event import Event, async_write_event
+from wyoming.satellite import RunSatellite
+
+# client.py only needs wyoming, so load it without Home Assistant
+_spec = importlib.util.spec_from_file_location(
+    "vaca_client",
+    os.path.join(
+        os.path.dirname(__file__), "..", "custom_components", "vaca", "client.py"
+    ),
+)
+assert _spec is not None and _spec.loader is not None
+client_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(client_module)
+
+
+class LegacyClient(AsyncTcpClient):
+    """Client as it was before callbacks were registered by event type."""
+
+    def __init__(
+        self,
+        host,
+        port,
+        before_send_callback=None,
+        after_send_callback=None,
+        on_receive_callback=None,
+    ) -> None:
+        super().__init__(host, port)
+        self._before_send_callback = before_send_callback
+        self._after_send_callback = after_send_callback
+        self._on_receive_callback = on_receive_callback
+
+    async def write_event(self, event: Event) -> None:
+        if self._before_send_callback:
+            await self._before_send_callback(event)
+        if self._writer is not None and not self._writer.is_closing():
+            await super().write_event(event)
+        if self._after_send_callback:
+            await self._after_send_callback(event)
+
+    async def read_event(self) -> Event:
+        event = await super().read_event()
+        if self._on_receive_callback:
+            await self._on_receive_callback(event)
+        return event
+
+
+class NullWriter:
+    """Stream writer that collects or discards written data."""
+
+    def __init__(self, keep: bool = False) -> None:
+        self.data = bytearray() if keep else None
+
+    def write(self, data: bytes) -> None:
+        if self.data is not None:
+            self.data += data
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+    async def drain(self) -> None:
+        pass
+
+    def is_closing(self) -> bool:
+        return False
+
+
+async def _on_event(event: Event) -> None:
+    """Satellite style callback that only acts on a few event types."""
+    if RunSatellite.is_type(event.type):
+        pass
+
+
+async def _serialized_chunks(count: int) -> bytes:
+    """Return wire bytes for a number of 64ms audio chunks."""
+    writer = NullWriter(keep=True)
+    event = AudioChunk(rate=16000, width=2, channels=1, audio=bytes(2048)).event()
+    for _ in range(count):
+        await async_write_event(event, writer)
+    assert writer.data is not None
+    return bytes(writer.data)
+
+
+async def _time_write(client, count: int) -> float:
+    """Return seconds taken to write audio chunks."""
+    client._writer = NullWriter()
+    event = AudioChunk(rate=16000, width=2, channels=1, audio=bytes(2048)).event()
+    start = time.perf_counter()
+    for _ in range(count):
+        await client.write_event(event)
+    return time.perf_counter() - start
+
+
+async def _time_read(client, data: bytes, count: int) -> float:
+    """Return seconds taken to read audio chunks."""
+    reader = asyncio.StreamReader(limit=len(data) + 1)
+    reader.feed_data(data)
+    reader.feed_eof()
+    client._reader = reader
+    start = time.perf_counter()
+    for _ in range(count):
+        await client.read_event()
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100000)
+    args = parser.parse_args()
+
+    legacy = LegacyClient(
+        "localhost",
+        0,
+        before_send_callback=_on_event,
+        after_send_callback=_on_event,
+        on_receive_callback=_on_event,
+    )
+    run_satellite_type = RunSatellite().event().type
+    current = client_module.VAAsyncTcpClient(
+        "localhost",
+        0,
+        before_send_callbacks={run_satellite_type: _on_event},
+        after_send_callbacks={run_satellite_type: _on_event},
+        on_receive_callbacks={"custom-status": _on_event},
+    )
+    baseline = AsyncTcpClient("localhost", 0)
+    data = await _serialized_chunks(args.events)
+
+    results = {}
+    for name, client in (
+        ("no callbacks", baseline),
+        ("legacy", legacy),
+        ("by type", current),
+    ):
+        write = min([await _time_write(client, args.events) for _ in range(3)])
+        read = min([await _time_read(client, data, args.events) for _ in range(3)])
+        results[name] = (write, read)
+
+    base_write, base_read = results["no callbacks"]
+    print(f"{args.events} audio chunk events, per event:")
+    for name, (write, read) in results.items():
+        print(
+            f"  {name:12s} write {write / args.events * 1e9:7.0f}ns "
+            f"({(write - base_write) / args.events * 1e9:+6.0f}ns)  "
+            f"read {read / args.events * 1e9:7.0f}ns "
+            f"({(read - base_read) / args.events * 1e9:+6.0f}ns)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+"""Measure config entry startup of a satellite fleet with some asleep.
+
+Starts fake VACA satellites on local ports (see fakes.py), some of which
+accept connections but never answer, as a sleeping tablet does.  Then sets
+up the service of every entry concurrently, as Home Assistant does at
+startup:
+
+- live: WyomingService.create for every entry, as before the info cache
+- cached: async_create_service after a restart, with info of every
+  satellite saved by an earlier run
+
+Reports the time until all entries are set up, the slowest entry, and how
+many entries were not ready.  Needs a Home Assistant development
+environment.  Run from the repository root:
+
+    python benchmarks/bench_startup.py [--satellites 30] [--asleep 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+import os
+import sys
+import tempfile
+import time
+from types import MappingProxyType
+
+from fakes import (
+    FakeSatelliteHandler,
+    FakeTimings,
+    SatelliteLog,
+    async_start_server,
+)
+from wyoming.event import Event
+
+from homeassistant.components.wyoming import WyomingService
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT, EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HomeAssistant
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from custom_components.vaca.const import DOMAIN
+from custom_components.vaca.info_cache import (
+    InfoCache,
+    async_create_service,
+)
+
+
+@dataclass
+class Power:
+    """Whether a fake satellite is asleep."""
+
+    asleep: bool = False
+
+
+class SleepySatelliteHandler(FakeSatelliteHandler):
+    """Fake satellite that ignores all events while asleep."""
+
+    def __init__(self, power: Power, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.power = power
+
+    async def handle_event(self, event: Event) -> bool:
+        if self.power.asleep:
+            return True
+        return await super().handle_event(event)
+
+
+def _config_entry(port: int) -> ConfigEntry:
+    """Create a config entry that is not added to Home Assistant."""
+    return ConfigEntry(
+        data={CONF_HOST: "127.0.0.1", CONF_PORT: port},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source="zeroconf",
+        subentries_data=None,
+        title=f"Satellite {port}",
+        unique_id=None,
+        version=1,
+    )
+
+
+async def _setup_all(
+    entries: list[ConfigEntry],
+    create: Callable[[ConfigEntry], Awaitable[WyomingService | None]],
+) -> tuple[float, float, int]:
+    """Set up all entries concurrently.
+
+    Returns the time until all were set up, the slowest entry and the number
+    that were not ready.
+    """
+    start = time.perf_counter()
+
+    async def _setup(entry: ConfigEntry) -> tuple[float, bool]:
+        service = await create(entry)
+        return time.perf_counter() - start, service is not None
+
+    results = await asyncio.gather(*(_setup(entry) for entry in entries))
+    return (
+        time.perf_counter() - start,
+        max(seconds for seconds, _ in results),
+        sum(1 for _, ready in results if not ready),
+    )
+
+
+async def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--satellites", type=int, default=30)
+    parser.add_argument("--asleep", type=int, default=5)
+    args = parser.parse_args()
+
+    timings = FakeTimings()
+    servers = []
+    powers: list[Power] = []
+    entries: list[ConfigEntry] = []
+    for _ in range(args.satellites):
+        power = Power()
+        server, port = await async_start_server(
+            partial(SleepySatelliteHandler, power, SatelliteLog(), timings)
+        )
+        servers.append(server)
+        powers.append(power)
+        entries.append(_config_entry(port))
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        try:
+            # First start with every satellite awake fills the cache, which
+            # is written when Home Assistant stops
+            cache = InfoCache(hass)
+            await _setup_all(
+                entries, lambda entry: async_create_service(hass, entry, cache)
+            )
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+            await hass.async_block_till_done()
+
+            for power in powers[: args.asleep]:
+                power.asleep = True
+
+            live = await _setup_all(
+                entries,
+                lambda entry: WyomingService.create(
+                    entry.data[CONF_HOST], entry.data[CONF_PORT]
+                ),
+            )
+
+            # Restart with a new cache loaded from the store
+            cache = InfoCache(hass)
+            cached = await _setup_all(
+                entries, lambda entry: async_create_service(hass, entry, cache)
+            )
+        finally:
+            for server in servers:
+                await server.stop()
+            await hass.async_stop(force=True)
+
+    print(f"{args.satellites} satellites, {args.asleep} asleep:")
+    for name, (total, slowest, not_ready) in (("live", live), ("cached", cached)):
+        print(
+            f"  {name:8s} all set up in {total * 1000:8.1f}ms  "
+            f"slowest {slowest * 1000:8.1f}ms  {not_ready:3d} not ready"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
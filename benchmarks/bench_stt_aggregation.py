@@ -0,0 +1,127 @@
+"""Measure mic audio aggregation before it is sent to the ASR service.
+
+Feeds mic audio in small buffers, as satellites send it, through
+async_aggregate_audio at several frame sizes and serializes an AudioChunk
+event per frame, as WyomingSttProvider does.  Reports events and bytes on
+the wire, serialization throughput, and the delay added by holding audio
+back until a frame is full, assuming buffers arrive in real time.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_stt_aggregation.py [--seconds 60] [--buffer-ms 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator
+import os
+import sys
+import time
+
+from wyoming.audio import AudioChunk
+from wyoming.event import async_write_event
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from custom_components.vaca.audio import async_aggregate_audio
+from custom_components.vaca.const import (
+    SAMPLE_CHANNELS,
+    SAMPLE_RATE,
+    SAMPLE_WIDTH,
+)
+
+BYTES_PER_MS = SAMPLE_RATE * SAMPLE_WIDTH * SAMPLE_CHANNELS // 1000
+FRAME_MS = (0, 20, 50, 100, 200)
+
+
+class CountingWriter:
+    """Stream writer that counts and discards written data."""
+
+    def __init__(self) -> None:
+        self.bytes = 0
+
+    def write(self, data: bytes) -> None:
+        self.bytes += len(data)
+
+    def writelines(self, lines) -> None:
+        for line in lines:
+            self.write(line)
+
+    async def drain(self) -> None:
+        pass
+
+
+async def _mic_stream(buffers: int, buffer_bytes: int) -> AsyncIterator[bytes]:
+    """Yield silent mic audio buffers."""
+    for _ in range(buffers):
+        yield bytes(buffer_bytes)
+
+
+async def _run(buffers: int, buffer_ms: int, frame_ms: int) -> tuple[int, int, float]:
+    """Return events and bytes written, and seconds taken."""
+    writer = CountingWriter()
+    events = 0
+    start = time.perf_counter()
+    async for audio in async_aggregate_audio(
+        _mic_stream(buffers, buffer_ms * BYTES_PER_MS), frame_ms * BYTES_PER_MS
+    ):
+        chunk = AudioChunk(
+            rate=SAMPLE_RATE,
+            width=SAMPLE_WIDTH,
+            channels=SAMPLE_CHANNELS,
+            audio=audio,
+        )
+        await async_write_event(chunk.event(), writer)
+        events += 1
+    return events, writer.bytes, time.perf_counter() - start
+
+
+def _added_delay_ms(buffer_ms: int, frame_ms: int) -> tuple[float, float]:
+    """Return mean and maximum delay added to a buffer by aggregation.
+
+    A buffer is sent when the frame it completes or belongs to is full, so
+    it waits for the buffers after it in the same frame.
+    """
+    if frame_ms <= buffer_ms:
+        return 0.0, 0.0
+    per_frame = frame_ms // buffer_ms
+    delays = [(per_frame - 1 - i) * buffer_ms for i in range(per_frame)]
+    return sum(delays) / len(delays), float(max(delays))
+
+
+async def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--buffer-ms", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    buffers = args.seconds * 1000 // args.buffer_ms
+    audio_bytes = buffers * args.buffer_ms * BYTES_PER_MS
+    print(
+        f"{args.seconds}s of mic audio in {args.buffer_ms}ms buffers "
+        f"({audio_bytes} bytes of audio):"
+    )
+    for frame_ms in FRAME_MS:
+        results = [
+            await _run(buffers, args.buffer_ms, frame_ms) for _ in range(args.runs)
+        ]
+        events, wire_bytes, _ = results[0]
+        seconds = min(result[2] for result in results)
+        mean_delay, max_delay = _added_delay_ms(args.buffer_ms, frame_ms)
+        name = f"{frame_ms}ms frames" if frame_ms else "no aggregation"
+        print(
+            f"  {name:16s} {events:7d} events  "
+            f"{(wire_bytes - audio_bytes) / audio_bytes:6.1%} overhead  "
+            f"{audio_bytes / seconds / 1e6:8.1f}MB/s  "
+            f"{events / seconds:10.0f} events/s  "
+            f"added delay mean {mean_delay:5.1f}ms max {max_delay:5.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,372 @@
+"""End to end latency benchmark of the voice loop against stand-in services.
+
+Starts fake ASR, TTS and wake word servers and a fake VACA satellite on
+local ports (see fakes.py), then drives the integration's providers and
+satellite entity against them:
+
+- wake: audio streamed to WyomingWakeWordProvider until detection
+- stt: audio streamed to WyomingSttProvider until the transcript
+- tts: WyomingTtsProvider synthesis, with the cache cleared each run
+- tts_cached: WyomingTtsProvider returning a cached response
+- settings: a setting change until it arrives at the satellite as a delta,
+  then checks that a missed delta and a removed setting resync the
+  satellite to the same settings
+- announce: ViewAssistSatelliteEntity announcement until played
+- status: a burst of custom-status events read by the satellite client
+
+Reports p50, p95 and p99 latency and events per second for each stage.
+Needs a Home Assistant development environment.  Run from the repository
+root:
+
+    python benchmarks/bench_voice_loop.py [--runs 50] [--asr-delay 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+import math
+import os
+import sys
+import tempfile
+import time
+from types import MappingProxyType
+import wave
+
+from fakes import (
+    CUSTOM_STATUS_TYPE,
+    STATUS_BURST_ACTION,
+    FakeAsrHandler,
+    FakeSatelliteHandler,
+    FakeTimings,
+    FakeTtsHandler,
+    FakeWakeHandler,
+    SatelliteLog,
+    async_start_server,
+    handler_factory,
+)
+from wyoming.snd import Played
+
+from homeassistant.components import stt
+from homeassistant.components.assist_satellite import AssistSatelliteAnnouncement
+from homeassistant.components.ffmpeg import FFmpegManager
+from homeassistant.components.wyoming import WyomingService
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from custom_components.vaca.assist_satellite import (
+    ViewAssistSatelliteEntity,
+)
+from custom_components.vaca.cache import AudioCache
+from custom_components.vaca.const import (
+    CONF_AUDIO_LEAD_SECONDS,
+    DOMAIN,
+    SAMPLE_RATE,
+)
+from custom_components.vaca.devices import VASatelliteDevice
+from custom_components.vaca.pool import WyomingConnectionPool
+from custom_components.vaca.stt import WyomingSttProvider
+from custom_components.vaca.tts import WyomingTtsProvider
+from custom_components.vaca.wake_word import WyomingWakeWordProvider
+
+AUDIO_CHUNK = bytes(2048)  # 64ms at 16kHz
+CHUNK_MS = 64
+
+
+@dataclass
+class StageResult:
+    """Timings of one benchmark stage."""
+
+    name: str
+    latencies: list[float]
+    events: int
+    elapsed: float
+
+    def percentile(self, percent: float) -> float:
+        """Return a latency percentile in milliseconds."""
+        ordered = sorted(self.latencies)
+        index = max(0, math.ceil(len(ordered) * percent / 100) - 1)
+        return ordered[index] * 1000
+
+    def __str__(self) -> str:
+        """Format result."""
+        return (
+            f"{self.name:12s} p50 {self.percentile(50):8.2f}ms  "
+            f"p95 {self.percentile(95):8.2f}ms  "
+            f"p99 {self.percentile(99):8.2f}ms  "
+            f"{self.events / self.elapsed:10.0f} events/s"
+        )
+
+
+async def _run_stage(
+    name: str, runs: int, run_once: Callable[[], Awaitable[int]]
+) -> StageResult:
+    """Run a stage a number of times, timing each run."""
+    latencies: list[float] = []
+    events = 0
+    stage_start = time.perf_counter()
+    for _ in range(runs):
+        start = time.perf_counter()
+        events += await run_once()
+        latencies.append(time.perf_counter() - start)
+    return StageResult(name, latencies, events, time.perf_counter() - stage_start)
+
+
+def _config_entry(options: dict) -> ConfigEntry:
+    """Create a config entry that is not added to Home Assistant."""
+    return ConfigEntry(
+        data={},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options=options,
+        source="user",
+        subentries_data=None,
+        title="Benchmark",
+        unique_id=None,
+        version=1,
+    )
+
+
+async def _audio_stream(chunks: int) -> AsyncIterator[bytes]:
+    """Yield silent mic audio."""
+    for _ in range(chunks):
+        yield AUDIO_CHUNK
+
+
+async def _timestamped_stream(chunks: int) -> AsyncIterator[tuple[bytes, int]]:
+    """Yield silent mic audio with timestamps."""
+    for i in range(chunks):
+        yield AUDIO_CHUNK, i * CHUNK_MS
+
+
+def _write_announcement(path: str, seconds: float) -> None:
+    """Write a silent announcement at the satellite sample rate."""
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setframerate(22050)
+        wav_file.setsampwidth(2)
+        wav_file.setnchannels(1)
+        wav_file.writeframes(bytes(int(22050 * seconds) * 2))
+
+
+async def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--stt-chunks", type=int, default=30)
+    parser.add_argument("--asr-delay", type=float, default=0.05)
+    parser.add_argument("--tts-delay", type=float, default=0.05)
+    parser.add_argument("--wake-chunks", type=int, default=10)
+    parser.add_argument("--announce-seconds", type=float, default=3.0)
+    parser.add_argument("--audio-lead", type=float, default=0.0)
+    parser.add_argument("--status-events", type=int, default=1000)
+    args = parser.parse_args()
+
+    timings = FakeTimings(
+        asr_delay=args.asr_delay,
+        tts_first_chunk_delay=args.tts_delay,
+        wake_after_chunks=args.wake_chunks,
+    )
+    satellite_log = SatelliteLog()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        servers = []
+        pools: list[WyomingConnectionPool] = []
+        results: list[StageResult] = []
+
+        async def _start(handler_class, *handler_args):
+            server, port = await async_start_server(
+                handler_factory(handler_class, timings, *handler_args)
+            )
+            servers.append(server)
+            return port
+
+        def _pool(port: int) -> WyomingConnectionPool:
+            pool = WyomingConnectionPool(hass, "127.0.0.1", port, 4, 60, 30)
+            pools.append(pool)
+            return pool
+
+        try:
+            entry = _config_entry({CONF_AUDIO_LEAD_SECONDS: args.audio_lead})
+
+            # Wake word
+            port = await _start(FakeWakeHandler)
+            wake = WyomingWakeWordProvider(
+                hass,
+                entry,
+                WyomingService("127.0.0.1", port, FakeWakeHandler.info),
+            )
+
+            async def _wake() -> int:
+                result = await wake._async_process_audio_stream(
+                    _timestamped_stream(args.wake_chunks * 2), None
+                )
+                assert result is not None
+                return args.wake_chunks
+
+            results.append(await _run_stage("wake", args.runs, _wake))
+
+            # Speech to text
+            port = await _start(FakeAsrHandler)
+            stt_provider = WyomingSttProvider(
+                entry,
+                WyomingService("127.0.0.1", port, FakeAsrHandler.info),
+                _pool(port),
+            )
+            metadata = stt.SpeechMetadata(
+                language="en",
+                format=stt.AudioFormats.WAV,
+                codec=stt.AudioCodecs.PCM,
+                bit_rate=stt.AudioBitRates.BITRATE_16,
+                sample_rate=SAMPLE_RATE,
+                channel=stt.AudioChannels.CHANNEL_MONO,
+            )
+
+            async def _stt() -> int:
+                result = await stt_provider.async_process_audio_stream(
+                    metadata, _audio_stream(args.stt_chunks)
+                )
+                assert result.result == stt.SpeechResultState.SUCCESS
+                return args.stt_chunks
+
+            results.append(await _run_stage("stt", args.runs, _stt))
+
+            # Text to speech
+            port = await _start(FakeTtsHandler)
+            tts_cache = AudioCache(hass, "tts", max_bytes=8 * 1024 * 1024)
+            tts_provider = WyomingTtsProvider(
+                entry,
+                WyomingService("127.0.0.1", port, FakeTtsHandler.info),
+                _pool(port),
+                tts_cache,
+            )
+
+            async def _tts() -> int:
+                tts_cache.clear()
+                extension, data = await tts_provider.async_get_tts_audio(
+                    "The lights are on", "en", {}
+                )
+                assert extension == "wav" and data
+                return timings.tts_chunks
+
+            async def _tts_cached() -> int:
+                await tts_provider.async_get_tts_audio("The lights are on", "en", {})
+                return 1
+
+            results.append(await _run_stage("tts", args.runs, _tts))
+            results.append(await _run_stage("tts_cached", args.runs, _tts_cached))
+
+            # Satellite
+            port = await _start(FakeSatelliteHandler, satellite_log)
+            device = VASatelliteDevice(satellite_id="benchmark", device_id="benchmark")
+            satellite = ViewAssistSatelliteEntity(
+                hass,
+                WyomingService("127.0.0.1", port, FakeSatelliteHandler.info),
+                device,
+                entry,
+            )
+            satellite.hass = hass
+            satellite._ffmpeg_manager = FFmpegManager(hass, "ffmpeg")
+            satellite._played_event_received = asyncio.Event()
+            await satellite._connect()
+            client = satellite._client
+            assert client is not None
+
+            # Stand in for the satellite event loop in Home Assistant.  Info
+            # and settings resync events are handled by the client callbacks
+            status_events = asyncio.Queue()
+
+            async def _read_satellite() -> None:
+                while (event := await client.read_event()) is not None:
+                    if Played.is_type(event.type):
+                        satellite._played_event_received.set()
+                    elif event.type == CUSTOM_STATUS_TYPE:
+                        status_events.put_nowait(event)
+
+            reader_task = asyncio.create_task(_read_satellite())
+
+            # Info is not described here, so enable the deltas the fake
+            # advertises and send the initial settings as on run-satellite
+            satellite._settings_delta_supported = True
+            await satellite._async_write_custom_settings()
+            await satellite_log.settings.get()
+
+            settings_counter = 0
+
+            async def _settings() -> int:
+                nonlocal settings_counter
+                settings_counter += 1
+                device.set_custom_setting("screen_brightness", settings_counter)
+                await satellite_log.settings.get()
+                return 1
+
+            results.append(await _run_stage("settings", args.runs, _settings))
+            assert satellite_log.settings_deltas == args.runs, "Deltas not applied"
+
+            # A missed delta makes the next one skip a version, so the
+            # satellite asks for all settings again
+            satellite_log.drop_next_delta = True
+            device.set_custom_setting("screen_brightness", 0)
+            await satellite_log.settings.get()
+            device.set_custom_setting("screen_mode", "dark")
+            await satellite_log.settings.get()
+            await satellite_log.settings.get()
+            assert satellite_log.settings_resyncs == 1, "Settings not resynced"
+
+            # Removed settings cannot be sent as a delta
+            del device.custom_settings["screen_mode"]
+            satellite._custom_settings_changed()
+            await satellite_log.settings.get()
+            assert satellite_log.applied_settings == device.custom_settings, (
+                "Satellite settings differ"
+            )
+
+            announcement_path = os.path.join(config_dir, "announcement.wav")
+            _write_announcement(announcement_path, args.announce_seconds)
+            announcement = AssistSatelliteAnnouncement(
+                message="",
+                media_id=announcement_path,
+                original_media_id=announcement_path,
+                tts_token=None,
+                media_id_source="url",
+            )
+
+            async def _announce() -> int:
+                chunks_before = satellite_log.audio_chunks
+                await satellite.async_announce(announcement)
+                return satellite_log.audio_chunks - chunks_before
+
+            results.append(await _run_stage("announce", args.runs, _announce))
+
+            async def _status() -> int:
+                satellite._send_custom_action(
+                    STATUS_BURST_ACTION, {"count": args.status_events}
+                )
+                for _ in range(args.status_events):
+                    await status_events.get()
+                return args.status_events
+
+            results.append(await _run_stage("status", args.runs, _status))
+
+            reader_task.cancel()
+            await satellite._disconnect()
+        finally:
+            for pool in pools:
+                await pool.async_close()
+            for server in servers:
+                await server.stop()
+            await hass.async_stop(force=True)
+
+    print(f"{args.runs} runs per stage:")
+    for result in results:
+        print(f"  {result}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
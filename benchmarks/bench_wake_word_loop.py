@@ -0,0 +1,256 @@
+"""Compare task churn and CPU of the wake word streaming loops.
+
+The previous loop created a task for every audio chunk and every server
+event and waited on the pair.  The current loop runs one audio reader,
+one audio forwarder and one event reader for the whole stream, with a
+bounded queue between the reader and the forwarder.  Both loops stream
+silent audio to a stand-in client that discards writes and never detects,
+so the measurement is the loop overhead.  Reports tasks created and CPU
+time, scaled to an hour of audio.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_wake_word_loop.py [--seconds 600] [--chunk-ms 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import AsyncIterable
+import logging
+import os
+import sys
+import time
+from typing import Self
+
+from fakes import FakeWakeHandler
+from wyoming.audio import AudioChunk, AudioStart
+from wyoming.event import Event
+from wyoming.wake import Detect, Detection
+
+from homeassistant.components import wake_word
+from homeassistant.components.wyoming import WyomingService
+
+# pylint: disable-next=hass-component-root-import
+from homeassistant.components.wyoming.error import WyomingError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pylint: disable=wrong-import-position
+from custom_components.vaca.wake_word import WyomingWakeWordProvider
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NullClient:
+    """Client that discards events and never receives any."""
+
+    def __init__(self) -> None:
+        self.events = 0
+
+    async def write_event(self, event: Event) -> None:
+        self.events += 1
+
+    async def read_event(self) -> Event | None:
+        await asyncio.get_running_loop().create_future()
+        return None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+class LegacyWakeWordProvider(WyomingWakeWordProvider):
+    """Provider with the loop as it was before the audio queue."""
+
+    async def _async_process_audio_stream(
+        self, stream: AsyncIterable[tuple[bytes, int]], wake_word_id: str | None
+    ) -> wake_word.DetectionResult | None:
+        """Try to detect one or more wake words in an audio stream.
+
+        Audio must be 16Khz sample rate with 16-bit mono PCM samples.
+        """
+
+        async def next_chunk():
+            """Get the next chunk from audio stream."""
+            async for chunk_bytes in stream:
+                return chunk_bytes
+            return None
+
+        try:
+            async with self._create_client() as client:
+                # Inform client which wake word we want to detect (None = default)
+                await client.write_event(
+                    Detect(names=[wake_word_id] if wake_word_id else None).event()
+                )
+
+                await client.write_event(
+                    AudioStart(
+                        rate=16000,
+                        width=2,
+                        channels=1,
+                    ).event(),
+                )
+
+                # Read audio and wake events in "parallel"
+                audio_task = asyncio.create_task(next_chunk())
+                wake_task = asyncio.create_task(client.read_event())
+                pending = {audio_task, wake_task}
+
+                try:
+                    while True:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+
+                        if wake_task in done:
+                            event = wake_task.result()
+                            if event is None:
+                                _LOGGER.debug("Connection lost")
+                                break
+
+                            if Detection.is_type(event.type):
+                                # Possible detection
+                                detection = Detection.from_event(event)
+                                _LOGGER.info(detection)
+
+                                if wake_word_id and (detection.name != wake_word_id):
+                                    _LOGGER.warning(
+                                        "Expected wake word %s but got %s, skipping",
+                                        wake_word_id,
+                                        detection.name,
+                                    )
+                                    wake_task = asyncio.create_task(client.read_event())
+                                    pending.add(wake_task)
+                                    continue
+
+                                # Retrieve queued audio
+                                queued_audio: list[tuple[bytes, int]] | None = None
+                                if audio_task in pending:
+                                    # Save queued audio
+                                    await audio_task
+                                    pending.remove(audio_task)
+                                    queued_audio = [audio_task.result()]
+
+                                return wake_word.DetectionResult(
+                                    wake_word_id=detection.name or "",
+                                    wake_word_phrase=self._get_phrase(
+                                        detection.name or ""
+                                    ),
+                                    timestamp=detection.timestamp,
+                                    queued_audio=queued_audio,
+                                )
+
+                            # Next event
+                            wake_task = asyncio.create_task(client.read_event())
+                            pending.add(wake_task)
+
+                        if audio_task in done:
+                            # Forward audio to wake service
+                            chunk_info = audio_task.result()
+                            if chunk_info is None:
+                                break
+
+                            chunk_bytes, chunk_timestamp = chunk_info
+                            chunk = AudioChunk(
+                                rate=16000,
+                                width=2,
+                                channels=1,
+                                audio=chunk_bytes,
+                                timestamp=chunk_timestamp,
+                            )
+                            await client.write_event(chunk.event())
+
+                            # Next chunk
+                            audio_task = asyncio.create_task(next_chunk())
+                            pending.add(audio_task)
+                finally:
+                    # Clean up
+                    if audio_task in pending:
+                        # It's critical that we don't cancel the audio task or
+                        # leave it hanging. This would mess up the pipeline STT
+                        # by stopping the audio stream.
+                        await audio_task
+                        pending.remove(audio_task)
+
+                    for task in pending:
+                        task.cancel()
+
+        except (OSError, WyomingError):
+            _LOGGER.exception("Error processing audio stream")
+
+        return None
+
+
+class _ConfigEntry:
+    """Config entry stand-in providing the entry id used for the unique id."""
+
+    entry_id = "benchmark"
+
+
+async def _mic_stream(chunks: int, chunk_bytes: int, chunk_ms: int):
+    """Yield silent mic audio with timestamps, yielding to the loop each time."""
+    audio = bytes(chunk_bytes)
+    for i in range(chunks):
+        await asyncio.sleep(0)
+        yield audio, i * chunk_ms
+
+
+async def _measure(
+    provider: WyomingWakeWordProvider, chunks: int, chunk_bytes: int, chunk_ms: int
+) -> tuple[int, float, float]:
+    """Return tasks created, CPU seconds and wall seconds for one stream."""
+    loop = asyncio.get_running_loop()
+    tasks = 0
+
+    def _task_factory(loop, coro, **kwargs):
+        nonlocal tasks
+        tasks += 1
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    loop.set_task_factory(_task_factory)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    try:
+        result = await provider._async_process_audio_stream(
+            _mic_stream(chunks, chunk_bytes, chunk_ms), None
+        )
+    finally:
+        loop.set_task_factory(None)
+    assert result is None
+    return tasks, time.process_time() - cpu_start, time.perf_counter() - wall_start
+
+
+async def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=int, default=600)
+    parser.add_argument("--chunk-ms", type=int, default=10)
+    args = parser.parse_args()
+
+    chunks = args.seconds * 1000 // args.chunk_ms
+    chunk_bytes = 32 * args.chunk_ms  # 16kHz 16-bit mono
+    per_hour = 3600 / args.seconds
+    service = WyomingService("127.0.0.1", 0, FakeWakeHandler.info)
+
+    print(f"{args.seconds}s of audio in {args.chunk_ms}ms chunks, per hour of audio:")
+    for name, provider_class in (
+        ("legacy", LegacyWakeWordProvider),
+        ("queue", WyomingWakeWordProvider),
+    ):
+        client = NullClient()
+        provider = provider_class(None, _ConfigEntry(), service)
+        provider._create_client = lambda client=client: client
+        tasks, cpu, wall = await _measure(provider, chunks, chunk_bytes, args.chunk_ms)
+        assert client.events == chunks + 2
+        print(
+            f"  {name:8s} {tasks * per_hour:12.0f} tasks  "
+            f"{cpu * per_hour:7.2f}s CPU  {wall * per_hour:7.2f}s wall"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
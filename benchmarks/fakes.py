@@ -0,0 +1,298 @@
+"""Stand-in Wyoming services and VACA satellite for benchmarks.
+
+Each fake is a wyoming event handler served on a local TCP port, with
+configurable processing delays so the integration can be measured without
+a tablet or real ASR, TTS and wake word servers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from functools import partial
+import time
+from typing import Any
+
+from wyoming.asr import Transcript
+from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.event import Event
+from wyoming.info import (
+    AsrModel,
+    AsrProgram,
+    Attribution,
+    Describe,
+    Info,
+    Satellite,
+    TtsProgram,
+    TtsVoice,
+    WakeModel,
+    WakeProgram,
+)
+from wyoming.ping import Ping, Pong
+from wyoming.server import AsyncEventHandler, AsyncTcpServer
+from wyoming.snd import Played
+from wyoming.tts import Synthesize
+from wyoming.wake import Detect, Detection
+
+# Event types of the VACA app protocol, written out here so the fake
+# satellite speaks the wire protocol without importing the integration
+CUSTOM_SETTINGS_TYPE = "custom-settings"
+CUSTOM_SETTINGS_DELTA_TYPE = "custom-settings-delta"
+CUSTOM_SETTINGS_RESYNC_TYPE = "custom-settings-resync"
+CUSTOM_ACTION_TYPE = "custom-action"
+CUSTOM_STATUS_TYPE = "custom-status"
+
+# Custom action that asks the fake satellite to send a burst of status events
+STATUS_BURST_ACTION = "benchmark-status-burst"
+
+_ATTRIBUTION = Attribution(name="benchmark", url="")
+_LANGUAGE = "en"
+
+
+@dataclass
+class FakeTimings:
+    """Simulated processing times of the fake services, in seconds."""
+
+    asr_delay: float = 0.05
+    tts_first_chunk_delay: float = 0.05
+    tts_chunk_delay: float = 0.0
+    tts_chunks: int = 50
+    tts_rate: int = 22050
+    wake_after_chunks: int = 10
+
+
+@dataclass
+class SatelliteLog:
+    """Events received by the fake satellite, with monotonic arrival times."""
+
+    settings: asyncio.Queue[tuple[float, Event]] = field(default_factory=asyncio.Queue)
+    applied_settings: dict[str, Any] = field(default_factory=dict)
+    settings_version: int | None = None
+    settings_deltas: int = 0
+    settings_resyncs: int = 0
+    drop_next_delta: bool = False
+    audio_chunks: int = 0
+    audio_stops: int = 0
+
+
+class _FakeHandler(AsyncEventHandler):
+    """Event handler that answers describe with fixed info."""
+
+    info: Info
+
+    def __init__(
+        self,
+        timings: FakeTimings,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        super().__init__(reader, writer)
+        self.timings = timings
+
+    async def handle_event(self, event: Event) -> bool:
+        if Describe.is_type(event.type):
+            await self.write_event(self.info.event())
+        return True
+
+
+class FakeAsrHandler(_FakeHandler):
+    """Speech to text service returning a fixed transcript."""
+
+    info = Info(
+        asr=[
+            AsrProgram(
+                name="fake-asr",
+                attribution=_ATTRIBUTION,
+                installed=True,
+                description="Benchmark ASR",
+                version="1.0",
+                models=[
+                    AsrModel(
+                        name="fake",
+                        attribution=_ATTRIBUTION,
+                        installed=True,
+                        description=None,
+                        version=None,
+                        languages=[_LANGUAGE],
+                    )
+                ],
+            )
+        ]
+    )
+
+    async def handle_event(self, event: Event) -> bool:
+        if AudioStop.is_type(event.type):
+            await asyncio.sleep(self.timings.asr_delay)
+            await self.write_event(Transcript(text="turn on the lights").event())
+            return True
+        return await super().handle_event(event)
+
+
+class FakeTtsHandler(_FakeHandler):
+    """Text to speech service returning silence."""
+
+    info = Info(
+        tts=[
+            TtsProgram(
+                name="fake-tts",
+                attribution=_ATTRIBUTION,
+                installed=True,
+                description="Benchmark TTS",
+                version="1.0",
+                voices=[
+                    TtsVoice(
+                        name="fake",
+                        attribution=_ATTRIBUTION,
+                        installed=True,
+                        description=None,
+                        version=None,
+                        languages=[_LANGUAGE],
+                    )
+                ],
+            )
+        ]
+    )
+
+    async def handle_event(self, event: Event) -> bool:
+        if Synthesize.is_type(event.type):
+            rate = self.timings.tts_rate
+            await asyncio.sleep(self.timings.tts_first_chunk_delay)
+            await self.write_event(AudioStart(rate=rate, width=2, channels=1).event())
+            audio = bytes(2048)
+            for _ in range(self.timings.tts_chunks):
+                if self.timings.tts_chunk_delay:
+                    await asyncio.sleep(self.timings.tts_chunk_delay)
+                await self.write_event(
+                    AudioChunk(rate=rate, width=2, channels=1, audio=audio).event()
+                )
+            await self.write_event(AudioStop().event())
+            return True
+        return await super().handle_event(event)
+
+
+class FakeWakeHandler(_FakeHandler):
+    """Wake word service detecting after a fixed number of audio chunks."""
+
+    info = Info(
+        wake=[
+            WakeProgram(
+                name="fake-wake",
+                attribution=_ATTRIBUTION,
+                installed=True,
+                description="Benchmark wake word",
+                version="1.0",
+                models=[
+                    WakeModel(
+                        name="fake_jarvis",
+                        attribution=_ATTRIBUTION,
+                        installed=True,
+                        description=None,
+                        version=None,
+                        languages=[_LANGUAGE],
+                        phrase="hey jarvis",
+                    )
+                ],
+            )
+        ]
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._chunks = 0
+
+    async def handle_event(self, event: Event) -> bool:
+        if Detect.is_type(event.type):
+            self._chunks = 0
+        elif AudioChunk.is_type(event.type):
+            self._chunks += 1
+            if self._chunks == self.timings.wake_after_chunks:
+                chunk = AudioChunk.from_event(event)
+                await self.write_event(
+                    Detection(name="fake_jarvis", timestamp=chunk.timestamp).event()
+                )
+            return True
+        return await super().handle_event(event)
+
+
+class FakeSatelliteHandler(_FakeHandler):
+    """VACA app speaking the custom settings, action and status events."""
+
+    info = Info(
+        satellite=Satellite(
+            name="fake-vaca",
+            attribution=_ATTRIBUTION,
+            installed=True,
+            description="Benchmark VACA satellite",
+            version="1.0",
+        )
+    )
+
+    def __init__(self, log: SatelliteLog, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.log = log
+
+    async def handle_event(self, event: Event) -> bool:
+        if Describe.is_type(event.type):
+            info_event = self.info.event()
+            info_event.data["satellite"]["capabilities"] = ["settings-delta"]
+            await self.write_event(info_event)
+        elif event.type == CUSTOM_SETTINGS_TYPE:
+            self.log.applied_settings = dict(event.data["settings"])
+            self.log.settings_version = event.data.get("version")
+            self.log.settings.put_nowait((time.monotonic(), event))
+        elif event.type == CUSTOM_SETTINGS_DELTA_TYPE:
+            await self._apply_settings_delta(event)
+            self.log.settings.put_nowait((time.monotonic(), event))
+        elif AudioChunk.is_type(event.type):
+            self.log.audio_chunks += 1
+        elif AudioStop.is_type(event.type):
+            self.log.audio_stops += 1
+            await self.write_event(Played().event())
+        elif Ping.is_type(event.type):
+            await self.write_event(Pong(text=Ping.from_event(event).text).event())
+        elif (
+            event.type == CUSTOM_ACTION_TYPE
+            and event.data.get("action") == STATUS_BURST_ACTION
+        ):
+            count = int(event.data["payload"]["count"])
+            for i in range(count):
+                await self.write_event(
+                    Event(
+                        type=CUSTOM_STATUS_TYPE,
+                        data={"sensors": {"light": i, "orientation": "1"}},
+                    )
+                )
+        return True
+
+    async def _apply_settings_delta(self, event: Event) -> None:
+        """Apply a settings delta, or ask for all settings if one was missed."""
+        if self.log.drop_next_delta:
+            # Lost in transit
+            self.log.drop_next_delta = False
+            return
+
+        version = event.data["version"]
+        last_version = self.log.settings_version
+        if last_version is None or version != last_version + 1:
+            self.log.settings_resyncs += 1
+            await self.write_event(
+                Event(type=CUSTOM_SETTINGS_RESYNC_TYPE, data={"version": last_version})
+            )
+            return
+
+        self.log.applied_settings.update(event.data["changes"])
+        self.log.settings_version = version
+        self.log.settings_deltas += 1
+
+
+async def async_start_server(handler_factory) -> tuple[AsyncTcpServer, int]:
+    """Start a server on a free local port and return it with the port."""
+    server = AsyncTcpServer("127.0.0.1", 0)
+    await server.start(handler_factory)
+    assert server._server is not None
+    return server, server._server.sockets[0].getsockname()[1]
+
+
+def handler_factory(handler_class, timings: FakeTimings, *args):
+    """Return a factory for a fake handler with shared settings."""
+    return partial(handler_class, *args, timings)
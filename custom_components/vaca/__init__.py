@@ -2,22 +2,24 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
+import shutil
 
-from homeassistant.components.wyoming import (
-    DomainDataItem,
-    WyomingService,
-    async_register_websocket_api,
-)
+from homeassistant.components.wyoming import async_register_websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.typing import ConfigType
 
-from .const import ATTR_SPEAKER, DOMAIN
+from .const import ATTR_SPEAKER, DOMAIN, TTS_CACHE_DIR
 from .devices import VASatelliteDevice
+from .hub import async_get_hub
+from .info_cache import async_create_service
+from .models import VADomainDataItem
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +37,7 @@ SATELLITE_PLATFORMS = [
 __all__ = [
     "ATTR_SPEAKER",
     "DOMAIN",
+    "async_remove_entry",
     "async_setup",
     "async_setup_entry",
     "async_unload_entry",
@@ -44,20 +47,29 @@ __all__ = [
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Wyoming integration."""
     async_register_websocket_api(hass)
+    async_get_hub(hass)
+    async_setup_services(hass)
 
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Load Wyoming."""
-    service = await WyomingService.create(entry.data["host"], entry.data["port"])
+    hub = async_get_hub(hass)
+
+    # Cached info lets entries set up without waiting for the device
+    service = await async_create_service(hass, entry, hub.info_cache)
 
     if service is None:
         raise ConfigEntryNotReady("Unable to connect")
 
-    item = DomainDataItem(service=service)
+    item = VADomainDataItem(service=service, options=dict(entry.options))
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = item
 
+    if service.platforms:
+        # Reuse connections to STT and TTS services
+        item.pool = hub.async_acquire_pool(entry.entry_id, service.host, service.port)
+
     await hass.config_entries.async_forward_entry_setups(entry, service.platforms)
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
@@ -78,6 +90,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             satellite_id=satellite_id,
             device_id=device.id,
         )
+        entry.async_on_unload(hub.async_register_satellite(entry.entry_id, item.device))
 
         # Set up satellite entity, sensors, switches, etc.
         await hass.config_entries.async_forward_entry_setups(entry, SATELLITE_PLATFORMS)
@@ -87,12 +100,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
+    item: VADomainDataItem = hass.data[DOMAIN][entry.entry_id]
+    if (
+        item.service.host == entry.data[CONF_HOST]
+        and item.service.port == entry.data[CONF_PORT]
+        and item.options == entry.options
+    ):
+        # Satellite has already moved to its new address without a reload
+        return
+
     await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Wyoming."""
-    item: DomainDataItem = hass.data[DOMAIN][entry.entry_id]
+    item: VADomainDataItem = hass.data[DOMAIN][entry.entry_id]
 
     platforms = list(item.service.platforms)
     if item.device is not None:
@@ -100,6 +122,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
+        if item.pool is not None:
+            await async_get_hub(hass).async_release_pool(
+                entry.entry_id, item.pool.host, item.pool.port
+            )
         del hass.data[DOMAIN][entry.entry_id]
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove cached info and TTS audio of a removed entry."""
+    await async_get_hub(hass).info_cache.async_remove(entry.entry_id)
+
+    # Disk spill may have been enabled at some point, so always remove it
+    await hass.async_add_executor_job(
+        partial(
+            shutil.rmtree,
+            hass.config.path(TTS_CACHE_DIR, entry.entry_id),
+            ignore_errors=True,
+        )
+    )
@@ -3,50 +3,130 @@
 from __future__ import annotations
 
 import asyncio
-import io
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from contextlib import suppress
 import logging
+import os
 import time
-from typing import Final
-import wave
+from typing import Any, Final
 
+import aiohttp
+from wyoming.asr import TranscriptChunk
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 from wyoming.event import Event
+from wyoming.info import Info
+from wyoming.ping import Ping, Pong
 from wyoming.pipeline import PipelineStage, RunPipeline
 from wyoming.satellite import RunSatellite
+from wyoming.snd import Played
+from yarl import URL
 
 from homeassistant.components import assist_pipeline, ffmpeg, tts
-from homeassistant.components.assist_pipeline import PipelineEvent
+from homeassistant.components.assist_pipeline import PipelineEvent, PipelineEventType
 from homeassistant.components.assist_satellite import (
     AssistSatelliteAnnouncement,
     AssistSatelliteEntityDescription,
     AssistSatelliteEntityFeature,
+    SatelliteBusyError,
 )
+
+# pylint: disable-next=hass-component-root-import
+from homeassistant.components.assist_satellite.entity import AssistSatelliteState
 from homeassistant.components.wyoming import DomainDataItem, WyomingService
 
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.wyoming.assist_satellite import WyomingAssistSatellite
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .client import VAAsyncTcpClient
-from .const import DOMAIN, INTENT_EVENT, SAMPLE_CHANNELS, SAMPLE_WIDTH
-from .custom import CustomAction, CustomSettings, CustomStatus
+from .audio import AudioPacer, WavStreamParser, async_iter_wav_pcm
+from .backoff import ReconnectBackoff
+from .client import EventBatch, VAAsyncTcpClient
+from .const import (
+    CONF_AUDIO_LEAD_SECONDS,
+    CONF_RECONNECT_MAX_SECONDS,
+    CONF_RECONNECT_MIN_SECONDS,
+    CONF_STT_PARTIAL_INTERVAL,
+    DEFAULT_AUDIO_LEAD_SECONDS,
+    DEFAULT_RECONNECT_MAX_SECONDS,
+    DEFAULT_RECONNECT_MIN_SECONDS,
+    DEFAULT_STT_PARTIAL_INTERVAL,
+    DOMAIN,
+    LATENCY_INTENT,
+    LATENCY_PLAYBACK,
+    LATENCY_RESPONSE,
+    LATENCY_STT,
+    LATENCY_TTS,
+    SAMPLE_CHANNELS,
+    SAMPLE_WIDTH,
+)
+from .custom import (
+    SETTINGS_DELTA_CAPABILITY,
+    CustomAction,
+    CustomSettings,
+    CustomSettingsDelta,
+    CustomSettingsResync,
+    CustomStatus,
+)
 from .devices import VASatelliteDevice
 from .entity import VASatelliteEntity
+from .hub import async_get_hub
+from .metrics import RollingStats
 
 _LOGGER = logging.getLogger(__name__)
 
 _SAMPLES_PER_CHUNK: Final = 1024
-_RECONNECT_SECONDS: Final = 10
-_RESTART_SECONDS: Final = 3
 _PING_TIMEOUT: Final = 5
 _PING_SEND_DELAY: Final = 2
 _PIPELINE_FINISH_TIMEOUT: Final = 1
 _TTS_SAMPLE_RATE: Final = 22050
 _ANNOUNCE_CHUNK_BYTES: Final = 2048  # 1024 samples
+_FFMPEG_READ_BYTES: Final = 8 * _ANNOUNCE_CHUNK_BYTES
 _TTS_TIMEOUT_EXTRA: Final = 1.0
+_AUTH_SIGN_PARAM: Final = "authSig"
+_TTS_PROXY_PATH: Final = "/api/tts_proxy/"
+_WAV_EXTENSION: Final = ".wav"
+_WAV_DOWNLOAD_CHUNK_BYTES: Final = 16384
+_CUSTOM_SETTINGS_DEBOUNCE_SECONDS: Final = 0.5
+
+# Event types that need handling in the client callbacks
+_RUN_SATELLITE_TYPE: Final = RunSatellite().event().type
+_PING_TYPE: Final = Ping().event().type
+_RECEIVE_CALLBACK_TYPES: Final = (
+    Info().event().type,
+    CustomSettingsResync().event().type,
+    CustomStatus(data=None).event().type,
+    Played().event().type,
+    Pong().event().type,
+)
+
+# Points in a pipeline run that are timed, in addition to pipeline events
+_FIRST_AUDIO_MARK: Final = "first-audio"
+_PLAYED_MARK: Final = "played"
+
+# Latency stages, with the marks they are timed from in order of preference
+# and the mark they are timed to
+_LATENCY_STAGES: Final = (
+    (
+        LATENCY_STT,
+        (PipelineEventType.STT_VAD_END, PipelineEventType.STT_START),
+        PipelineEventType.STT_END,
+    ),
+    (LATENCY_INTENT, (PipelineEventType.STT_END,), PipelineEventType.INTENT_END),
+    (LATENCY_TTS, (PipelineEventType.TTS_START,), _FIRST_AUDIO_MARK),
+    (
+        LATENCY_RESPONSE,
+        (PipelineEventType.STT_VAD_END, PipelineEventType.STT_END),
+        _FIRST_AUDIO_MARK,
+    ),
+)
 
 
 async def async_setup_entry(
@@ -97,13 +177,72 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         self.device.set_custom_action_listener(self._send_custom_action)
 
         # Make info accessible from entities
-        self.device.info = service.info
+        self.device.set_info(service.info)
 
         # Init custom settings
         self.device.custom_settings = {}
 
+        # Settings last sent to the satellite, so only changes need sending
+        # to apps that support deltas
+        self._custom_settings_version = 0
+        self._sent_custom_settings: dict[str, Any] = {}
+        self._settings_delta_supported = False
+
+        # Merge bursts of setting changes, such as when entities are restored
+        self._custom_settings_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_CUSTOM_SETTINGS_DEBOUNCE_SECONDS,
+            immediate=False,
+            function=self._async_send_custom_settings,
+            background=True,
+        )
+
+        # Times of the current pipeline run, used to measure stage latencies
+        self._pipeline_marks: dict[str, float] = {}
+        self._tts_audio_seconds: float | None = None
+
+        # Partial transcripts from the STT engine of the current run
+        self._unsub_transcript_chunk: Callable[[], None] | None = None
+        self._partial_transcript_sent = ""
+        self._partial_transcript_time = 0.0
+
+        # Decoded preannounce sounds and conversion limits are fleet wide
+        self._hub = async_get_hub(hass)
+
+        # Only one audio stream is sent at a time, so a broadcast or
+        # announcement does not interleave with pipeline TTS
+        self._audio_lock = asyncio.Lock()
+
+        # Delays between reconnection attempts grow while the satellite is
+        # unreachable, and are cut short when it is announced again
+        self._backoff = ReconnectBackoff(
+            config_entry.options.get(
+                CONF_RECONNECT_MIN_SECONDS, DEFAULT_RECONNECT_MIN_SECONDS
+            ),
+            config_entry.options.get(
+                CONF_RECONNECT_MAX_SECONDS, DEFAULT_RECONNECT_MAX_SECONDS
+            ),
+        )
+        self.device.reconnect_backoff = self._backoff
+        self._connected_at: float | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._hub.async_register_announcer(self))
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{DOMAIN}_{self.config_entry.entry_id}_discovered",
+                self._discovered,
+            )
+        )
+
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
+        self._custom_settings_debouncer.async_shutdown()
+        self._stop_partial_transcripts()
         try:
             await super().async_will_remove_from_hass()
         except AssertionError as ex:
@@ -111,6 +250,11 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
 
     async def on_before_send_event_callback(self, event: Event) -> None:
         """Allow injection of events before event sent."""
+        if RunSatellite().is_type(event.type):
+            # Pending changes are included in the settings sent after this
+            self._custom_settings_debouncer.async_cancel()
+        elif Ping.is_type(event.type):
+            self.device.link_quality.ping_sent(time.monotonic())
 
     async def on_after_send_event_callback(self, event: Event) -> None:
         """Allow injection of events after event sent."""
@@ -121,28 +265,44 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
                 self.hass.config.internal_url if self.hass.config.internal_url else ""
             )
             # Send config event
-            await self._client.write_event(
-                CustomSettings(self.device.custom_settings).event()
-            )
+            await self._async_write_custom_settings()
 
     async def on_receive_event_callback(self, event: Event) -> None:
         """Handle received custom events."""
-        if event and CustomStatus.is_type(event.type):
+        if event and Pong.is_type(event.type):
+            self.device.link_quality.pong_received(time.monotonic())
+        elif event and Played.is_type(event.type):
+            self._mark_pipeline_time(_PLAYED_MARK)
+        elif event and Info.is_type(event.type):
+            # Capabilities are not part of the wyoming Info model so read the raw event
+            satellite_info = event.data.get("satellite") or {}
+            self._settings_delta_supported = SETTINGS_DELTA_CAPABILITY in (
+                satellite_info.get("capabilities") or []
+            )
+            # Satellite has reconnected, so its wake words may have changed
+            info = Info.from_event(event)
+            self.device.set_info(info)
+            self._hub.info_cache.async_set(self.config_entry.entry_id, info)
+        elif event and CustomSettingsResync.is_type(event.type):
+            # Satellite missed a delta so send all settings again
+            _LOGGER.debug(
+                "Satellite requested settings resync from version %s",
+                CustomSettingsResync.from_event(event).version,
+            )
+            await self._async_write_custom_settings()
+        elif event and CustomStatus.is_type(event.type):
             # Custom status event
             status = CustomStatus.from_event(event)
             _LOGGER.debug(
                 "Received status event: %s",
                 status.data,
             )
-            async_dispatcher_send(
-                self.hass,
-                f"{DOMAIN}_{self.device.device_id}_status_update",
-                status.data,
-            )
+            self.device.status_router.async_route(status.data)
 
     async def _connect(self) -> None:
         """Connect to satellite over TCP.  Uses custom TCP client to allow callbacks on send."""
         await self._disconnect()
+        self._settings_delta_supported = False
 
         _LOGGER.debug(
             "Connecting VACA to satellite at %s:%s",
@@ -152,11 +312,75 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         self._client = VAAsyncTcpClient(
             self.service.host,
             self.service.port,
-            before_send_callback=self.on_before_send_event_callback,
-            after_send_callback=self.on_after_send_event_callback,
-            on_receive_callback=self.on_receive_event_callback,
+            before_send_callbacks=dict.fromkeys(
+                (_RUN_SATELLITE_TYPE, _PING_TYPE), self.on_before_send_event_callback
+            ),
+            after_send_callbacks={
+                _RUN_SATELLITE_TYPE: self.on_after_send_event_callback
+            },
+            on_receive_callbacks=dict.fromkeys(
+                _RECEIVE_CALLBACK_TYPES, self.on_receive_event_callback
+            ),
         )
         await self._client.connect()
+        self._connected_at = time.monotonic()
+
+    async def on_restart(self) -> None:
+        """Block until pipeline loop will be restarted."""
+        # Pings time out when the satellite stops answering
+        self.device.link_quality.ping_unanswered()
+
+        if (
+            self._connected_at is not None
+            and time.monotonic() - self._connected_at >= self._backoff.maximum
+        ):
+            # Connection was up for a while, so this is not a reconnect loop
+            self._backoff.reset()
+        self._connected_at = None
+
+        delay = self._backoff.next_delay()
+        _LOGGER.warning(
+            "Satellite has been disconnected. Reconnecting in %.1f second(s)",
+            delay,
+        )
+        await self._backoff.async_wait(delay)
+
+    async def on_reconnect(self) -> None:
+        """Block until a reconnection attempt should be made."""
+        delay = self._backoff.next_delay()
+        _LOGGER.debug(
+            "Failed to connect to satellite. Reconnecting in %.1f second(s)",
+            delay,
+        )
+        if await self._backoff.async_wait(delay):
+            _LOGGER.debug("Satellite announced, reconnecting now")
+
+    @callback
+    def _discovered(self, host: str, port: int) -> None:
+        """Reconnect straight away to a satellite announced over zeroconf."""
+        if (host, port) != (self.service.host, self.service.port):
+            _LOGGER.info(
+                "Satellite moved from %s:%s to %s:%s",
+                self.service.host,
+                self.service.port,
+                host,
+                port,
+            )
+            # Update in place so the entry does not need reloading
+            self.service.host = host
+            self.service.port = port
+            if self._client is not None:
+                # Connection to the old address is dead, even if unnoticed
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self._client.disconnect(),
+                    "vaca satellite moved disconnect",
+                )
+        elif self._client is not None and self._connected_at is not None:
+            # Still connected, so nothing to do
+            return
+
+        self._backoff.wake()
 
     def on_pipeline_event(self, event: PipelineEvent) -> None:
         """Handle pipeline events from the assist pipeline.
@@ -167,6 +391,18 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         updating listeners for speech-to-text and text-to-speech outputs.
         MSP - Added by MSP1974 2025-07-08
         """
+        self._mark_pipeline_time(event.type)
+
+        if event.type == assist_pipeline.PipelineEventType.STT_START:
+            if event.data:
+                self._start_partial_transcripts(event.data["engine"])
+        elif event.type in (
+            assist_pipeline.PipelineEventType.STT_END,
+            assist_pipeline.PipelineEventType.ERROR,
+            assist_pipeline.PipelineEventType.RUN_END,
+        ):
+            self._stop_partial_transcripts()
+
         if event.type == assist_pipeline.PipelineEventType.STT_END:
             # Speech-to-text transcript
             if event.data:
@@ -206,11 +442,77 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         Should block until the announcement is done playing.
         MSP - Fixes that Wyoming announce does not play preannounce sound
         """
-        assert self._client is not None
+        await self.async_play_audio(
+            self.async_iter_announcement_audio(announcement), "Announcement"
+        )
 
+    async def async_resolve_announcement(
+        self,
+        message: str,
+        media_id: str | None,
+        preannounce_media_id: str | None = None,
+    ) -> AssistSatelliteAnnouncement:
+        """Resolve announcement media, synthesizing message if no media is given."""
+        return await self._resolve_announcement_media_id(
+            message, media_id, preannounce_media_id
+        )
+
+    async def async_iter_announcement_audio(
+        self, announcement: AssistSatelliteAnnouncement
+    ) -> AsyncIterator[bytes]:
+        """Decode the preannounce sound, if set, and announcement media."""
         if self._ffmpeg_manager is None:
             self._ffmpeg_manager = ffmpeg.get_ffmpeg_manager(self.hass)
 
+        # Play preannounce sound if set
+        if announcement.preannounce_media_id:
+            yield await self._async_get_preannounce_audio(
+                announcement.preannounce_media_id
+            )
+
+        async for audio in self._async_iter_media_audio(announcement.media_id):
+            yield audio
+
+    async def async_play_broadcast(self, audio_blocks: AsyncIterable[bytes]) -> None:
+        """Play broadcast audio as async_internal_announce plays announcements.
+
+        A running pipeline is cancelled, and the satellite is busy until the
+        audio has played.
+        """
+        await self._cancel_running_pipeline()
+
+        if self._is_announcing:
+            raise SatelliteBusyError
+
+        self._is_announcing = True
+        self._set_state(AssistSatelliteState.RESPONDING)
+        try:
+            await self.async_play_audio(audio_blocks, "Broadcast")
+        finally:
+            self._is_announcing = False
+            self._set_state(AssistSatelliteState.IDLE)
+
+    @property
+    def can_play_audio(self) -> bool:
+        """Return if the satellite is connected and can be sent audio."""
+        return self._client is not None and self._client.can_write_event()
+
+    async def async_play_audio(
+        self, audio_blocks: AsyncIterable[bytes], name: str
+    ) -> None:
+        """Play decoded PCM audio on the satellite.
+
+        Blocks until the audio is done playing.
+        """
+        async with self._audio_lock:
+            await self._async_play_audio(audio_blocks, name)
+
+    async def _async_play_audio(
+        self, audio_blocks: AsyncIterable[bytes], name: str
+    ) -> None:
+        """Play decoded PCM audio while holding the audio lock."""
+        assert self._client is not None
+
         if self._played_event_received is None:
             self._played_event_received = asyncio.Event()
 
@@ -225,88 +527,177 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         )
 
         timestamp = 0
-
-        # Play preannounce sound if set
-        if announcement.preannounce_media_id:
-            preannounce_proc = await asyncio.create_subprocess_exec(
-                self._ffmpeg_manager.binary,
-                "-i",
-                announcement.preannounce_media_id,
-                "-f",
-                "s16le",
-                "-ac",
-                str(SAMPLE_CHANNELS),
-                "-ar",
-                str(_TTS_SAMPLE_RATE),
-                "-nostats",
-                "pipe:",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                close_fds=False,  # use posix_spawn in CPython < 3.13
-            )
-            assert preannounce_proc.stdout is not None
-            while True:
-                chunk_bytes = await preannounce_proc.stdout.read(_ANNOUNCE_CHUNK_BYTES)
-                if not chunk_bytes:
-                    break
-
-                chunk = AudioChunk(
-                    rate=_TTS_SAMPLE_RATE,
-                    width=SAMPLE_WIDTH,
-                    channels=SAMPLE_CHANNELS,
-                    audio=chunk_bytes,
-                    timestamp=timestamp,
-                )
-                await self._client.write_event(chunk.event())
-
-                timestamp += chunk.milliseconds
-
+        pacer = self._create_audio_pacer()
         try:
-            # Use ffmpeg to convert to raw PCM audio with the appropriate format
-            proc = await asyncio.create_subprocess_exec(
-                self._ffmpeg_manager.binary,
-                "-i",
-                announcement.media_id,
-                "-f",
-                "s16le",
-                "-ac",
-                str(SAMPLE_CHANNELS),
-                "-ar",
-                str(_TTS_SAMPLE_RATE),
-                "-nostats",
-                "pipe:",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                close_fds=False,  # use posix_spawn in CPython < 3.13
-            )
-            assert proc.stdout is not None
-            while True:
-                chunk_bytes = await proc.stdout.read(_ANNOUNCE_CHUNK_BYTES)
-                if not chunk_bytes:
-                    break
-
-                chunk = AudioChunk(
-                    rate=_TTS_SAMPLE_RATE,
-                    width=SAMPLE_WIDTH,
-                    channels=SAMPLE_CHANNELS,
-                    audio=chunk_bytes,
-                    timestamp=timestamp,
-                )
-                await self._client.write_event(chunk.event())
-
-                timestamp += chunk.milliseconds
+            async with self._client.batch() as batch:
+                async for audio in audio_blocks:
+                    timestamp = await self._async_write_audio(
+                        batch, pacer, audio, timestamp
+                    )
+                    # Send what we have before waiting for more audio
+                    await batch.flush()
         finally:
             await self._client.write_event(AudioStop().event())
+            self._log_audio_pacing(name, pacer)
             if timestamp > 0:
-                # Wait the length of the audio or until we receive a played event
-                audio_seconds = timestamp / 1000
+                # Wait for the rest of the audio to play or until we receive a
+                # played event
                 try:
-                    async with asyncio.timeout(audio_seconds + 0.5):
+                    async with asyncio.timeout(pacer.remaining_seconds + 0.5):
                         await self._played_event_received.wait()
                 except TimeoutError:
                     # Older satellite clients will wait longer than necessary
                     _LOGGER.debug("Did not receive played event for announcement")
 
+    async def _async_iter_media_audio(self, media_id: str) -> AsyncIterator[bytes]:
+        """Decode media to raw PCM audio with the appropriate format.
+
+        WAV audio is decoded in process, ffmpeg is only used for other formats.
+        """
+        if (source := await self._async_open_wav_source(media_id)) is not None:
+            audio_sent = False
+            try:
+                async for audio in async_iter_wav_pcm(
+                    self.hass, source, _TTS_SAMPLE_RATE, self._hub.decode_semaphore
+                ):
+                    audio_sent = True
+                    yield audio
+            except (ValueError, aiohttp.ClientError) as ex:
+                if audio_sent:
+                    raise
+                _LOGGER.debug("Unable to decode %s as WAV: %s", media_id, ex)
+            else:
+                return
+
+        proc = await self._async_start_ffmpeg(media_id)
+        assert proc.stdout is not None
+        try:
+            while chunk_bytes := await proc.stdout.read(_FFMPEG_READ_BYTES):
+                yield chunk_bytes
+            await proc.wait()
+        finally:
+            if proc.returncode is None:
+                with suppress(ProcessLookupError):
+                    proc.kill()
+                await proc.wait()
+
+        if proc.returncode != 0:
+            _LOGGER.warning(
+                "ffmpeg exited with code %s converting %s", proc.returncode, media_id
+            )
+
+    async def _async_open_wav_source(
+        self, media_id: str
+    ) -> AsyncIterable[bytes] | None:
+        """Open media as a WAV byte stream if it can be read without ffmpeg."""
+        url = URL(media_id)
+
+        if url.path.startswith(_TTS_PROXY_PATH):
+            # Read TTS audio directly rather than fetching it from our own api
+            token = url.path.removeprefix(_TTS_PROXY_PATH)
+            stream = tts.async_get_stream(self.hass, token)
+            if stream is not None and stream.extension == "wav":
+                return stream.async_stream_result()
+            return None
+
+        if not url.path.lower().endswith(_WAV_EXTENSION):
+            return None
+
+        if url.scheme in ("http", "https"):
+            return self._async_iter_url(media_id)
+
+        if url.scheme in ("", "file") and (
+            data := await self.hass.async_add_executor_job(_read_file, url.path)
+        ):
+            return _async_iter_bytes(data)
+
+        return None
+
+    async def _async_iter_url(self, url: str) -> AsyncIterator[bytes]:
+        """Download media from a url in chunks."""
+        session = async_get_clientsession(self.hass)
+        async with session.get(url, raise_for_status=True) as response:
+            async for data in response.content.iter_chunked(_WAV_DOWNLOAD_CHUNK_BYTES):
+                yield data
+
+    async def _async_start_ffmpeg(self, media_id: str) -> asyncio.subprocess.Process:
+        """Start ffmpeg to convert media to raw PCM audio for the satellite."""
+        assert self._ffmpeg_manager is not None
+        return await asyncio.create_subprocess_exec(
+            self._ffmpeg_manager.binary,
+            "-i",
+            media_id,
+            "-f",
+            "s16le",
+            "-ac",
+            str(SAMPLE_CHANNELS),
+            "-ar",
+            str(_TTS_SAMPLE_RATE),
+            "-nostats",
+            "pipe:",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,  # use posix_spawn in CPython < 3.13
+        )
+
+    async def _async_get_preannounce_audio(self, media_id: str) -> bytes:
+        """Get decoded preannounce audio, from the cache if available."""
+        # Signed urls change on every announcement so ignore the signature
+        cache_key = str(URL(media_id).without_query_params(_AUTH_SIGN_PARAM))
+        if (audio := self._hub.preannounce_cache.get(cache_key)) is not None:
+            return audio
+
+        audio = b"".join(
+            [audio async for audio in self._async_iter_media_audio(media_id)]
+        )
+        if audio:
+            await self._hub.preannounce_cache.async_set(cache_key, audio)
+            _LOGGER.debug(
+                "Cached preannounce audio for %s: %s",
+                cache_key,
+                self._hub.preannounce_cache.stats,
+            )
+        return audio
+
+    async def _async_write_audio(
+        self, batch: EventBatch, pacer: AudioPacer, audio: bytes, timestamp: int
+    ) -> int:
+        """Send decoded audio to the satellite and return the next timestamp."""
+        for offset in range(0, len(audio), _ANNOUNCE_CHUNK_BYTES):
+            chunk = AudioChunk(
+                rate=_TTS_SAMPLE_RATE,
+                width=SAMPLE_WIDTH,
+                channels=SAMPLE_CHANNELS,
+                audio=audio[offset : offset + _ANNOUNCE_CHUNK_BYTES],
+                timestamp=timestamp,
+            )
+            await self._async_write_paced(batch, pacer, chunk)
+            timestamp += chunk.milliseconds
+
+        return timestamp
+
+    async def _async_write_paced(
+        self, batch: EventBatch, pacer: AudioPacer, chunk: AudioChunk
+    ) -> None:
+        """Send an audio chunk, first waiting if it is too far ahead of playback."""
+        if delay := pacer.delay(chunk.seconds):
+            await batch.flush()
+            await asyncio.sleep(delay)
+        await batch.write_event(chunk.event())
+
+    def _create_audio_pacer(self) -> AudioPacer:
+        """Create a pacer for streaming audio to the satellite."""
+        return AudioPacer(
+            self.config_entry.options.get(
+                CONF_AUDIO_LEAD_SECONDS, DEFAULT_AUDIO_LEAD_SECONDS
+            )
+        )
+
+    def _log_audio_pacing(self, name: str, pacer: AudioPacer) -> None:
+        """Record and log how well audio kept ahead of playback."""
+        self.device.audio_pacing_stats = pacer.stats
+        _LOGGER.debug("%s audio pacing: %s", name, self.device.audio_pacing_stats)
+
     async def async_start_conversation(
         self, start_announcement: AssistSatelliteAnnouncement
     ) -> None:
@@ -320,17 +711,138 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
             )
         )
 
-    def _custom_settings_changed(self) -> None:
-        """Run when device screen settings change."""
+    def _start_partial_transcripts(self, engine: str) -> None:
+        """Listen for partial transcripts from the STT engine of this run."""
+        self._stop_partial_transcripts()
+        self._partial_transcript_sent = ""
+        self._partial_transcript_time = 0.0
+        self._unsub_transcript_chunk = async_dispatcher_connect(
+            self.hass,
+            f"{DOMAIN}_{engine}_transcript_chunk",
+            self._partial_transcript,
+        )
+
+    def _stop_partial_transcripts(self) -> None:
+        """Stop listening for partial transcripts."""
+        if self._unsub_transcript_chunk is not None:
+            self._unsub_transcript_chunk()
+            self._unsub_transcript_chunk = None
+
+    @callback
+    def _partial_transcript(self, text: str) -> None:
+        """Pass the transcript so far to the STT sensor and the satellite.
+
+        Updates are rate limited; the final transcript at STT end is always
+        passed on.
+        """
+        now = time.monotonic()
+        interval = self.config_entry.options.get(
+            CONF_STT_PARTIAL_INTERVAL, DEFAULT_STT_PARTIAL_INTERVAL
+        )
+        if now - self._partial_transcript_time < interval:
+            return
+        self._partial_transcript_time = now
+
+        if self.device.stt_listener is not None:
+            self.device.stt_listener(text)
+
+        # The satellite gets chunks as the ASR server sends them, so send
+        # what was added since the last update
+        sent = self._partial_transcript_sent
+        if not text.startswith(sent) or len(text) == len(sent):
+            return
+        self._partial_transcript_sent = text
         if self._client is not None and self._client.can_write_event():
             self.config_entry.async_create_background_task(
                 self.hass,
                 self._client.write_event(
-                    CustomSettings(self.device.custom_settings).event()
+                    TranscriptChunk(text=text[len(sent) :]).event()
                 ),
-                "custom settings event",
+                "partial transcript",
             )
 
+    def _mark_pipeline_time(self, mark: str) -> None:
+        """Record when a point in a pipeline run was reached and time stages."""
+        now = time.monotonic()
+        if mark == PipelineEventType.RUN_START:
+            self._pipeline_marks.clear()
+            self._tts_audio_seconds = None
+        self._pipeline_marks[mark] = now
+
+        for stage, start_marks, end_mark in _LATENCY_STAGES:
+            if mark != end_mark:
+                continue
+            for start_mark in start_marks:
+                if (start := self._pipeline_marks.get(start_mark)) is not None:
+                    self._add_latency(stage, now - start)
+                    break
+
+        if mark == _PLAYED_MARK:
+            # Time from the end of the response audio to the played event
+            first_audio = self._pipeline_marks.pop(_FIRST_AUDIO_MARK, None)
+            if first_audio is not None and self._tts_audio_seconds is not None:
+                self._add_latency(
+                    LATENCY_PLAYBACK,
+                    max(0.0, now - first_audio - self._tts_audio_seconds),
+                )
+
+    def _add_latency(self, stage: str, seconds: float) -> None:
+        """Add a stage latency and update sensors."""
+        stats = self.device.latency.setdefault(stage, RollingStats())
+        stats.add(seconds * 1000)
+        async_dispatcher_send(
+            self.hass, f"{DOMAIN}_{self.device.device_id}_latency", stage
+        )
+
+    def _custom_settings_changed(self) -> None:
+        """Run when device screen settings change."""
+        self._custom_settings_debouncer.async_schedule_call()
+
+    async def _async_send_custom_settings(self) -> None:
+        """Send custom settings to the satellite once changes have settled."""
+        if self._client is None or not self._client.can_write_event():
+            return
+
+        if self._settings_delta_supported and not (
+            # Deltas cannot remove settings, so send them all instead
+            self._sent_custom_settings.keys() - self.device.custom_settings.keys()
+        ):
+            changes = {
+                setting: value
+                for setting, value in self.device.custom_settings.items()
+                if setting not in self._sent_custom_settings
+                or self._sent_custom_settings[setting] != value
+            }
+            if changes:
+                await self._async_write_custom_settings_delta(changes)
+        else:
+            await self._async_write_custom_settings()
+        _LOGGER.debug("Sent custom settings: %s", self.device.custom_settings_stats)
+
+    async def _async_write_custom_settings(self) -> None:
+        """Write all custom settings to the satellite."""
+        assert self._client is not None
+        self._custom_settings_version += 1
+        self._sent_custom_settings = dict(self.device.custom_settings)
+        await self._client.write_event(
+            CustomSettings(
+                self._sent_custom_settings, version=self._custom_settings_version
+            ).event()
+        )
+        self.device.custom_settings_pushes += 1
+
+    async def _async_write_custom_settings_delta(self, changes: dict[str, Any]) -> None:
+        """Write changed custom settings to the satellite."""
+        assert self._client is not None
+        self._custom_settings_version += 1
+        self._sent_custom_settings.update(changes)
+        await self._client.write_event(
+            CustomSettingsDelta(
+                version=self._custom_settings_version, changes=changes
+            ).event()
+        )
+        self.device.custom_settings_pushes += 1
+
     def _send_custom_action(
         self, command: str, payload: str | float | None = None
     ) -> None:
@@ -345,7 +857,12 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
             )
 
     async def _stream_tts(self, tts_result: tts.ResultStream) -> None:
-        """Stream TTS WAV audio to satellite in chunks."""
+        """Stream TTS WAV audio to satellite in chunks as it is synthesized."""
+        async with self._audio_lock:
+            await self._async_stream_tts(tts_result)
+
+    async def _async_stream_tts(self, tts_result: tts.ResultStream) -> None:
+        """Stream TTS audio while holding the audio lock."""
         assert self._client is not None
 
         if tts_result.extension != "wav":
@@ -358,39 +875,70 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         start_time = time.monotonic()
 
         try:
-            data = b"".join([chunk async for chunk in tts_result.async_stream_result()])
-
-            with io.BytesIO(data) as wav_io, wave.open(wav_io, "rb") as wav_file:
-                sample_rate = wav_file.getframerate()
-                sample_width = wav_file.getsampwidth()
-                sample_channels = wav_file.getnchannels()
-                _LOGGER.debug("Streaming %s TTS sample(s)", wav_file.getnframes())
-
-                timestamp = 0
-                await self._client.write_event(
-                    AudioStart(
-                        rate=sample_rate,
-                        width=sample_width,
-                        channels=sample_channels,
-                        timestamp=timestamp,
-                    ).event()
-                )
-
-                # Stream audio chunks
-                while audio_bytes := wav_file.readframes(_SAMPLES_PER_CHUNK):
-                    chunk = AudioChunk(
-                        rate=sample_rate,
-                        width=sample_width,
-                        channels=sample_channels,
-                        audio=audio_bytes,
-                        timestamp=timestamp,
-                    )
-                    await self._client.write_event(chunk.event())
-                    timestamp += chunk.seconds
-                    total_seconds += chunk.seconds
-
-                await self._client.write_event(AudioStop(timestamp=timestamp).event())
-                _LOGGER.debug("TTS streaming complete")
+            wav_parser = WavStreamParser()
+            chunk_bytes = 0
+            timestamp = 0
+            first_audio_sent = False
+            pacer = self._create_audio_pacer()
+
+            async with self._client.batch() as batch:
+                async for data in tts_result.async_stream_result():
+                    audio_bytes = wav_parser.feed(data)
+                    if not wav_parser.header_complete:
+                        continue
+
+                    if not chunk_bytes:
+                        # Header has just arrived so start audio on the satellite
+                        chunk_bytes = _SAMPLES_PER_CHUNK * wav_parser.frame_bytes
+                        await batch.write_event(
+                            AudioStart(
+                                rate=wav_parser.rate,
+                                width=wav_parser.width,
+                                channels=wav_parser.channels,
+                                timestamp=timestamp,
+                            ).event()
+                        )
+
+                    # Stream audio chunks
+                    for offset in range(0, len(audio_bytes), chunk_bytes):
+                        chunk = AudioChunk(
+                            rate=wav_parser.rate,
+                            width=wav_parser.width,
+                            channels=wav_parser.channels,
+                            audio=audio_bytes[offset : offset + chunk_bytes],
+                            timestamp=timestamp,
+                        )
+                        await self._async_write_paced(batch, pacer, chunk)
+                        # Wyoming timestamps are in milliseconds, these were
+                        # previously sent in seconds
+                        timestamp += chunk.milliseconds
+                        total_seconds += chunk.seconds
+
+                    # Send what we have before waiting for more synthesized audio
+                    await batch.flush()
+
+                    if timestamp and not first_audio_sent:
+                        first_audio_sent = True
+                        self._mark_pipeline_time(_FIRST_AUDIO_MARK)
+                        _LOGGER.debug(
+                            "TTS time to first audio: %.3fs",
+                            time.monotonic() - start_time,
+                        )
+
+            if not chunk_bytes:
+                _LOGGER.warning("TTS stream ended before WAV header was received")
+                return
+
+            await self._client.write_event(AudioStop(timestamp=timestamp).event())
+            self._tts_audio_seconds = total_seconds
+            _LOGGER.debug(
+                "TTS streaming complete: %.2fs audio in %.3fs (%s events, %s writes)",
+                total_seconds,
+                time.monotonic() - start_time,
+                batch.events,
+                batch.flushes,
+            )
+            self._log_audio_pacing("TTS", pacer)
         finally:
             send_duration = time.monotonic() - start_time
             timeout_seconds = max(0, total_seconds - send_duration + _TTS_TIMEOUT_EXTRA)
@@ -399,3 +947,19 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
                 self._tts_timeout(timeout_seconds, self._run_loop_id),
                 name="wyoming TTS timeout",
             )
+
+
+async def _async_iter_bytes(data: bytes) -> AsyncIterator[bytes]:
+    """Return bytes already in memory as an async iterator."""
+    yield data
+
+
+def _read_file(path: str) -> bytes | None:
+    """Read a local media file."""
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except OSError:
+        return None
@@ -0,0 +1,360 @@
+"""Audio helpers for View Assist satellites."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+import contextlib
+import struct
+import time
+from typing import Any, Final
+
+import numpy as np
+
+from homeassistant.core import HomeAssistant
+
+_RIFF_HEADER_BYTES: Final = 12
+_CHUNK_HEADER_BYTES: Final = 8
+_FMT_MIN_BYTES: Final = 16
+_FMT_EXTENSIBLE_BYTES: Final = 40
+_WAVE_FORMAT_PCM: Final = 0x0001
+_WAVE_FORMAT_EXTENSIBLE: Final = 0xFFFE
+
+# SubFormat GUIDs of extensible WAV files are the format code followed by this
+_SUBFORMAT_GUID_TAIL: Final = bytes.fromhex("000000001000800000aa00389b71")
+
+# Low-pass filter applied before resampling down by a fractional ratio, so
+# frequencies above the new Nyquist limit do not alias
+_RESAMPLE_FILTER_TAPS: Final = 101
+_RESAMPLE_CUTOFF: Final = 0.45  # of the output sample rate
+
+# Streaming encoders do not know the final length so write one of these
+_UNKNOWN_DATA_SIZES: Final = (0, 0xFFFFFFFF, 0x7FFFFFFF)
+
+
+class AudioPacer:
+    """Pace audio so it is sent a limited time ahead of playback.
+
+    Playback is assumed to start when the first audio is sent.  Audio is
+    sent as fast as it is available until it is lead_seconds ahead, so clips
+    shorter than the lead are sent in a single burst.  If audio arrives
+    after the satellite would have played everything sent so far, that is
+    counted as an underrun and playback is assumed to resume from there.
+    A lead of 0 disables pacing.
+    """
+
+    def __init__(self, lead_seconds: float) -> None:
+        """Initialise pacer."""
+        self.lead_seconds = lead_seconds
+        self._start: float | None = None
+        self.sent_seconds = 0.0
+        self.min_lead: float | None = None
+        self.underruns = 0
+        self.underrun_seconds = 0.0
+        self.paced_seconds = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return pacing statistics."""
+        return {
+            "lead_seconds": self.lead_seconds,
+            "audio_seconds": round(self.sent_seconds, 3),
+            "paced_seconds": round(self.paced_seconds, 3),
+            "min_lead_seconds": (
+                round(self.min_lead, 3) if self.min_lead is not None else None
+            ),
+            "underruns": self.underruns,
+            "underrun_seconds": round(self.underrun_seconds, 3),
+        }
+
+    @property
+    def remaining_seconds(self) -> float:
+        """Return how much of the audio sent is still to be played."""
+        if self._start is None:
+            return 0.0
+        return max(0.0, self.sent_seconds - (time.monotonic() - self._start))
+
+    def delay(self, seconds: float) -> float:
+        """Return how long to wait before sending audio of the given length."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+
+        lead = self.sent_seconds - (now - self._start)
+        if self.sent_seconds > 0 and lead < 0:
+            # Satellite has run out of audio, so playback has stalled
+            self.underruns += 1
+            self.underrun_seconds -= lead
+            self._start -= lead
+            lead = 0.0
+
+        if self.sent_seconds >= self.lead_seconds:
+            self.min_lead = lead if self.min_lead is None else min(self.min_lead, lead)
+
+        self.sent_seconds += seconds
+        if self.lead_seconds <= 0 or lead <= self.lead_seconds:
+            return 0.0
+
+        wait = lead - self.lead_seconds
+        self.paced_seconds += wait
+        return wait
+
+
+class WavStreamParser:
+    """Incrementally parse a WAV byte stream into its format and PCM audio.
+
+    Bytes are fed in as they arrive.  Once the fmt and data chunk headers
+    have been seen, the audio format is available and all following bytes
+    are returned as PCM, aligned to whole frames.
+    """
+
+    def __init__(self) -> None:
+        """Initialise parser."""
+        self._buffer = bytearray()
+        self._riff_checked = False
+        self._data_remaining: int | None = None
+        self.header_complete = False
+        self.rate: int | None = None
+        self.width: int | None = None
+        self.channels: int | None = None
+
+    @property
+    def frame_bytes(self) -> int:
+        """Return number of bytes in a single frame."""
+        assert self.width is not None and self.channels is not None
+        return self.width * self.channels
+
+    def feed(self, data: bytes) -> bytes:
+        """Add bytes to the parser and return any whole frames of audio."""
+        self._buffer += data
+
+        if not self.header_complete and not self._parse_header():
+            return b""
+
+        if (
+            self._data_remaining is not None
+            and len(self._buffer) > self._data_remaining
+        ):
+            # Ignore anything after the end of the data chunk
+            del self._buffer[self._data_remaining :]
+
+        audio_length = len(self._buffer) - (len(self._buffer) % self.frame_bytes)
+        audio = bytes(self._buffer[:audio_length])
+        del self._buffer[:audio_length]
+
+        if self._data_remaining is not None:
+            self._data_remaining -= audio_length
+
+        return audio
+
+    def _parse_header(self) -> bool:
+        """Consume WAV header chunks from the buffer.
+
+        Returns True once the start of the data chunk has been reached.
+        """
+        if not self._riff_checked:
+            if len(self._buffer) < _RIFF_HEADER_BYTES:
+                return False
+            if self._buffer[0:4] != b"RIFF" or self._buffer[8:12] != b"WAVE":
+                raise ValueError("Audio stream is not a WAV file")
+            del self._buffer[:_RIFF_HEADER_BYTES]
+            self._riff_checked = True
+
+        while len(self._buffer) >= _CHUNK_HEADER_BYTES:
+            chunk_id = bytes(self._buffer[0:4])
+            (chunk_size,) = struct.unpack_from("<I", self._buffer, 4)
+
+            if chunk_id == b"data":
+                if self.rate is None:
+                    raise ValueError("WAV data chunk found before fmt chunk")
+                del self._buffer[:_CHUNK_HEADER_BYTES]
+                if chunk_size not in _UNKNOWN_DATA_SIZES:
+                    self._data_remaining = chunk_size
+                self.header_complete = True
+                return True
+
+            # Chunks are word aligned
+            padded_size = chunk_size + (chunk_size & 1)
+            if len(self._buffer) < _CHUNK_HEADER_BYTES + padded_size:
+                return False
+
+            if chunk_id == b"fmt ":
+                self._parse_fmt(
+                    bytes(
+                        self._buffer[
+                            _CHUNK_HEADER_BYTES : _CHUNK_HEADER_BYTES + chunk_size
+                        ]
+                    )
+                )
+
+            del self._buffer[: _CHUNK_HEADER_BYTES + padded_size]
+
+        return False
+
+    def _parse_fmt(self, fmt: bytes) -> None:
+        """Read audio format from a fmt chunk."""
+        if len(fmt) < _FMT_MIN_BYTES:
+            raise ValueError("WAV fmt chunk is too short")
+
+        audio_format, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", fmt)
+        if audio_format == _WAVE_FORMAT_EXTENSIBLE:
+            # Actual format is in the SubFormat GUID, such as float samples
+            if len(fmt) < _FMT_EXTENSIBLE_BYTES:
+                raise ValueError("WAV extensible fmt chunk is too short")
+            (audio_format,) = struct.unpack_from("<H", fmt, 24)
+            if fmt[26:40] != _SUBFORMAT_GUID_TAIL:
+                raise ValueError("Unsupported WAV extensible SubFormat")
+
+        if audio_format != _WAVE_FORMAT_PCM:
+            raise ValueError(f"Unsupported WAV audio format: {audio_format}")
+
+        self.rate = rate
+        self.width = (bits + 7) // 8
+        self.channels = channels
+
+
+def convert_pcm(
+    audio: bytes, rate: int, width: int, channels: int, to_rate: int
+) -> bytes:
+    """Convert PCM audio to 16-bit mono at the given sample rate."""
+    if width == 1:
+        # 8-bit WAV audio is unsigned
+        samples = (np.frombuffer(audio, dtype=np.uint8).astype(np.float32) - 128) * 256
+    elif width == 2:
+        samples = np.frombuffer(audio, dtype="<i2").astype(np.float32)
+    elif width == 3:
+        raw = np.frombuffer(audio, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        samples = ((raw[:, 0] << 8 | raw[:, 1] << 16 | raw[:, 2] << 24) >> 16).astype(
+            np.float32
+        )
+    elif width == 4:
+        samples = (np.frombuffer(audio, dtype="<i4") >> 16).astype(np.float32)
+    else:
+        raise ValueError(f"Unsupported sample width: {width}")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+
+    if rate != to_rate and len(samples):
+        if rate > to_rate and rate % to_rate == 0:
+            # Average each group of samples, which also filters out frequencies
+            # that would alias
+            factor = rate // to_rate
+            samples = samples[: len(samples) - len(samples) % factor]
+            samples = samples.reshape(-1, factor).mean(axis=1)
+        else:
+            if rate > to_rate:
+                samples = _low_pass(samples, _RESAMPLE_CUTOFF * to_rate / rate)
+            out_length = int(len(samples) * to_rate / rate)
+            samples = np.interp(
+                np.arange(out_length) * (rate / to_rate),
+                np.arange(len(samples)),
+                samples,
+            )
+
+    return np.clip(np.rint(samples), -32768, 32767).astype("<i2").tobytes()
+
+
+def _low_pass(samples: np.ndarray, cutoff: float) -> np.ndarray:
+    """Filter out frequencies above cutoff, in cycles per sample."""
+    n = np.arange(_RESAMPLE_FILTER_TAPS) - (_RESAMPLE_FILTER_TAPS - 1) / 2
+    taps = np.sinc(2 * cutoff * n) * np.hamming(_RESAMPLE_FILTER_TAPS)
+    taps /= taps.sum()
+    return np.convolve(samples, taps, mode="same")
+
+
+async def async_iter_wav_pcm(
+    hass: HomeAssistant,
+    data: AsyncIterable[bytes],
+    to_rate: int,
+    semaphore: asyncio.Semaphore | None = None,
+) -> AsyncIterator[bytes]:
+    """Decode a WAV byte stream to 16-bit mono PCM at the given sample rate.
+
+    Audio already in the right format is passed through as it arrives.
+    Anything else is buffered in full and converted once the whole file has
+    been received, so it is not streamed and starts playing later.  A
+    semaphore limits how many conversions run at once.
+    """
+    wav_parser = WavStreamParser()
+    pass_through: bool | None = None
+    pending: list[bytes] = []
+
+    async for chunk in data:
+        audio = wav_parser.feed(chunk)
+        if not wav_parser.header_complete:
+            continue
+
+        if pass_through is None:
+            pass_through = (wav_parser.rate, wav_parser.width, wav_parser.channels) == (
+                to_rate,
+                2,
+                1,
+            )
+
+        if pass_through:
+            if audio:
+                yield audio
+        else:
+            pending.append(audio)
+
+    if not wav_parser.header_complete:
+        raise ValueError("WAV stream ended before audio data")
+
+    if pending:
+        assert wav_parser.rate is not None
+        async with semaphore or contextlib.nullcontext():
+            audio = await hass.async_add_executor_job(
+                convert_pcm,
+                b"".join(pending),
+                wav_parser.rate,
+                wav_parser.width,
+                wav_parser.channels,
+                to_rate,
+            )
+        yield audio
+
+
+async def async_aggregate_audio(
+    data: AsyncIterable[bytes], frame_bytes: int
+) -> AsyncIterator[bytes]:
+    """Group an audio stream into frames of frame_bytes.
+
+    Small buffers are copied into a preallocated frame, buffers of a frame or
+    more are passed on without copying while nothing is pending.  Whatever
+    remains when the stream ends is passed on as a short last frame.  A
+    frame size of 0 passes the stream on unchanged.
+    """
+    if frame_bytes <= 0:
+        async for chunk in data:
+            yield chunk
+        return
+
+    frame = bytearray(frame_bytes)
+    frame_view = memoryview(frame)
+    filled = 0
+
+    async for chunk in data:
+        chunk_view = memoryview(chunk)
+        offset = 0
+        size = len(chunk)
+        while offset < size:
+            if filled == 0 and size - offset >= frame_bytes:
+                yield (
+                    chunk
+                    if size == frame_bytes
+                    else bytes(chunk_view[offset : offset + frame_bytes])
+                )
+                offset += frame_bytes
+                continue
+
+            copied = min(frame_bytes - filled, size - offset)
+            frame_view[filled : filled + copied] = chunk_view[offset : offset + copied]
+            filled += copied
+            offset += copied
+            if filled == frame_bytes:
+                yield bytes(frame)
+                filled = 0
+
+    if filled:
+        yield bytes(frame_view[:filled])
@@ -0,0 +1,73 @@
+"""Backoff between attempts to reconnect to a satellite."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any
+
+
+class ReconnectBackoff:
+    """Exponential backoff with jitter between reconnection attempts.
+
+    Delays double from minimum up to maximum, and each is drawn at random
+    from the upper half of its range, so satellites that dropped together,
+    such as after a network outage, do not all reconnect at the same moment.
+    A wait can be cut short with wake, for example when the satellite is
+    announced again.
+    """
+
+    def __init__(self, minimum: float, maximum: float, factor: float = 2) -> None:
+        """Initialise backoff."""
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.factor = factor
+        self.attempts = 0
+        self.last_delay: float | None = None
+
+        self._wake = asyncio.Event()
+
+        self.waits = 0
+        self.woken = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return backoff statistics."""
+        return {
+            "attempts": self.attempts,
+            "last_delay": self.last_delay,
+            "waits": self.waits,
+            "woken": self.woken,
+        }
+
+    def next_delay(self) -> float:
+        """Return the delay before the next attempt."""
+        delay = self.minimum * self.factor**self.attempts
+        if delay < self.maximum:
+            self.attempts += 1
+        else:
+            delay = self.maximum
+        return random.uniform(delay / 2, delay)
+
+    def reset(self) -> None:
+        """Start again from the minimum delay."""
+        self.attempts = 0
+
+    def wake(self) -> None:
+        """End the current or next wait early."""
+        self._wake.set()
+
+    async def async_wait(self, delay: float) -> bool:
+        """Wait delay seconds before the next attempt and return if woken early."""
+        self.last_delay = delay
+        self.waits += 1
+        try:
+            async with asyncio.timeout(delay):
+                await self._wake.wait()
+        except TimeoutError:
+            return False
+
+        self._wake.clear()
+        self.woken += 1
+        self.reset()
+        return True
@@ -0,0 +1,139 @@
+"""Broadcast announcements to several View Assist satellites."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
+import logging
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from homeassistant.components.assist_satellite import SatelliteBusyError
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+if TYPE_CHECKING:
+    from .assist_satellite import ViewAssistSatelliteEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+BROADCAST_PLAYED = "played"
+BROADCAST_TIMEOUT = "timeout"
+BROADCAST_BUSY = "busy"
+BROADCAST_FAILED = "failed"
+BROADCAST_UNAVAILABLE = "unavailable"
+
+
+class SharedAudio:
+    """Decoded audio shared by the satellites of a broadcast.
+
+    Audio is decoded once and appended as it arrives.  Each satellite reads
+    it at its own pace, so a slow satellite only holds up itself.
+    """
+
+    def __init__(self) -> None:
+        """Initialise shared audio."""
+        self._blocks: list[bytes] = []
+        self._done = False
+        self._failed = False
+        self._condition = asyncio.Condition()
+
+    async def async_produce(self, audio_blocks: AsyncIterable[bytes]) -> None:
+        """Decode audio for all readers."""
+        try:
+            async for block in audio_blocks:
+                async with self._condition:
+                    self._blocks.append(block)
+                    self._condition.notify_all()
+        except BaseException:
+            self._failed = True
+            raise
+        finally:
+            async with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yield audio blocks from the start, waiting for more as needed."""
+        index = 0
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(
+                    lambda index=index: index < len(self._blocks) or self._done
+                )
+                blocks = self._blocks[index:]
+
+            if not blocks:
+                if self._failed:
+                    raise HomeAssistantError("Unable to decode broadcast audio")
+                return
+
+            index += len(blocks)
+            for block in blocks:
+                yield block
+
+
+async def async_broadcast(
+    hass: HomeAssistant,
+    satellites: list[ViewAssistSatelliteEntity],
+    message: str,
+    media_id: str | None,
+    preannounce_media_id: str | None,
+    timeout: float,
+) -> dict[str, str]:
+    """Play an announcement on satellites, decoding it only once.
+
+    Returns the outcome for each satellite entity id.
+    """
+    results: dict[str, str] = {}
+    available: list[ViewAssistSatelliteEntity] = []
+    for satellite in satellites:
+        if satellite.can_play_audio:
+            available.append(satellite)
+        else:
+            results[satellite.entity_id] = BROADCAST_UNAVAILABLE
+
+    if not available:
+        return results
+
+    # Media is the same for all satellites, so any of them can decode it
+    leader = available[0]
+    announcement = await leader.async_resolve_announcement(
+        message, media_id, preannounce_media_id
+    )
+    audio = SharedAudio()
+    decode_task = hass.async_create_background_task(
+        audio.async_produce(leader.async_iter_announcement_audio(announcement)),
+        "vaca broadcast decode",
+    )
+
+    async def _async_play(satellite: ViewAssistSatelliteEntity) -> str:
+        try:
+            async with asyncio.timeout(timeout):
+                await satellite.async_play_broadcast(audio)
+        except TimeoutError:
+            _LOGGER.warning("Broadcast to %s timed out", satellite.entity_id)
+            return BROADCAST_TIMEOUT
+        except SatelliteBusyError:
+            _LOGGER.warning("Broadcast to %s skipped, it is busy", satellite.entity_id)
+            return BROADCAST_BUSY
+        except (OSError, aiohttp.ClientError, HomeAssistantError) as ex:
+            _LOGGER.warning("Broadcast to %s failed: %s", satellite.entity_id, ex)
+            return BROADCAST_FAILED
+        return BROADCAST_PLAYED
+
+    outcomes = await asyncio.gather(
+        *(_async_play(satellite) for satellite in available)
+    )
+    results.update(
+        (satellite.entity_id, outcome)
+        for satellite, outcome in zip(available, outcomes, strict=True)
+    )
+
+    try:
+        await decode_task
+    except (OSError, ValueError, aiohttp.ClientError, HomeAssistantError) as ex:
+        _LOGGER.error("Unable to decode broadcast %s: %s", announcement.media_id, ex)
+
+    return results
@@ -0,0 +1,221 @@
+"""In-memory audio caches with optional spill to disk."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import hashlib
+import logging
+import os
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+_DISK_FILE_SUFFIX = ".bin"
+
+
+class AudioCache:
+    """Least recently used cache of audio bytes limited by total size.
+
+    Entries evicted from memory are optionally written to a directory on disk,
+    which has its own size limit and is also evicted least recently used first.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        max_bytes: int,
+        max_entries: int | None = None,
+        disk_path: str | None = None,
+        max_disk_bytes: int = 0,
+    ) -> None:
+        """Initialise cache."""
+        self.hass = hass
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.disk_path = disk_path if max_disk_bytes > 0 else None
+        self.max_disk_bytes = max_disk_bytes
+
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._bytes = 0
+        self._disk_entries: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_loaded = False
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spills = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "disk_entries": len(self._disk_entries),
+            "disk_bytes": self._disk_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "spills": self.spills,
+        }
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Get an entry from memory, marking it as recently used."""
+        if (data := self._entries.get(key)) is None:
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    async def async_get(self, key: Hashable) -> bytes | None:
+        """Get an entry from memory or disk."""
+        if (data := self.get(key)) is not None:
+            return data
+
+        if self.disk_path is not None:
+            await self._async_load_disk_index()
+            filename = _disk_filename(key)
+            if filename in self._disk_entries:
+                data = await self.hass.async_add_executor_job(
+                    _read_file, os.path.join(self.disk_path, filename)
+                )
+                if data is not None:
+                    self.disk_hits += 1
+                    self._disk_entries.move_to_end(filename)
+                    await self.async_set(key, data)
+                    return data
+
+                self._forget_disk_entry(filename)
+
+        self.misses += 1
+        return None
+
+    async def async_set(self, key: Hashable, data: bytes) -> None:
+        """Add an entry, evicting least recently used entries to fit."""
+        if len(data) > self.max_bytes:
+            _LOGGER.debug(
+                "Not caching %s bytes in %s cache, larger than cache size",
+                len(data),
+                self.name,
+            )
+            return
+
+        if (old_data := self._entries.pop(key, None)) is not None:
+            self._bytes -= len(old_data)
+
+        self._entries[key] = data
+        self._bytes += len(data)
+
+        evicted: list[tuple[Hashable, bytes]] = []
+        while self._bytes > self.max_bytes or (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ):
+            evicted_key, evicted_data = self._entries.popitem(last=False)
+            self._bytes -= len(evicted_data)
+            self.evictions += 1
+            evicted.append((evicted_key, evicted_data))
+
+        if evicted and self.disk_path is not None:
+            await self._async_spill(evicted)
+
+    def clear(self) -> None:
+        """Clear in-memory entries."""
+        self._entries.clear()
+        self._bytes = 0
+
+    async def _async_spill(self, evicted: list[tuple[Hashable, bytes]]) -> None:
+        """Write evicted entries to disk."""
+        assert self.disk_path is not None
+        await self._async_load_disk_index()
+
+        to_write: dict[str, bytes] = {}
+        for key, data in evicted:
+            if len(data) > self.max_disk_bytes:
+                continue
+            filename = _disk_filename(key)
+            self._forget_disk_entry(filename)
+            self._disk_entries[filename] = len(data)
+            self._disk_bytes += len(data)
+            to_write[filename] = data
+
+        to_remove: list[str] = []
+        while self._disk_bytes > self.max_disk_bytes:
+            filename, size = self._disk_entries.popitem(last=False)
+            self._disk_bytes -= size
+            if to_write.pop(filename, None) is None:
+                to_remove.append(filename)
+
+        self.spills += len(to_write)
+        await self.hass.async_add_executor_job(
+            _write_files, self.disk_path, to_write, to_remove
+        )
+
+    async def _async_load_disk_index(self) -> None:
+        """Index files left on disk by a previous run."""
+        if self._disk_loaded:
+            return
+
+        assert self.disk_path is not None
+        self._disk_loaded = True
+        for filename, size in await self.hass.async_add_executor_job(
+            _scan_dir, self.disk_path
+        ):
+            self._disk_entries[filename] = size
+            self._disk_bytes += size
+
+    def _forget_disk_entry(self, filename: str) -> None:
+        """Remove an entry from the disk index."""
+        if (size := self._disk_entries.pop(filename, None)) is not None:
+            self._disk_bytes -= size
+
+
+def _disk_filename(key: Hashable) -> str:
+    """Return a stable filename for a cache key."""
+    return hashlib.sha1(repr(key).encode()).hexdigest() + _DISK_FILE_SUFFIX
+
+
+def _scan_dir(path: str) -> list[tuple[str, int]]:
+    """Return cache files in a directory, oldest first."""
+    os.makedirs(path, exist_ok=True)
+    files = [
+        entry
+        for entry in os.scandir(path)
+        if entry.is_file() and entry.name.endswith(_DISK_FILE_SUFFIX)
+    ]
+    files.sort(key=lambda entry: entry.stat().st_mtime)
+    return [(entry.name, entry.stat().st_size) for entry in files]
+
+
+def _read_file(path: str) -> bytes | None:
+    """Read a cache file."""
+    try:
+        with open(path, "rb") as file:
+            return file.read()
+    except OSError:
+        return None
+
+
+def _write_files(path: str, to_write: dict[str, bytes], to_remove: list[str]) -> None:
+    """Write and remove cache files."""
+    for filename in to_remove:
+        try:
+            os.remove(os.path.join(path, filename))
+        except OSError:
+            pass
+
+    for filename, data in to_write.items():
+        try:
+            with open(os.path.join(path, filename), "wb") as file:
+                file.write(data)
+        except OSError as ex:
+            _LOGGER.debug("Unable to write audio cache file %s: %s", filename, ex)
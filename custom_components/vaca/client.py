@@ -1,42 +1,160 @@
 """Custom AsyncTCPClient for Wyoming events."""
 
+from collections.abc import Awaitable, Callable, Iterable
+import time
+from types import TracebackType
+from typing import Self
+
 from wyoming.client import AsyncTcpClient
-from wyoming.event import Event
+from wyoming.event import Event, async_write_event
+
+EventCallback = Callable[[Event], Awaitable[None]]
+
+DEFAULT_BATCH_MAX_BYTES = 32768
+DEFAULT_BATCH_MAX_DELAY = 0.05
 
 
 class VAAsyncTcpClient(AsyncTcpClient):
-    """Custom TCP client for Wyoming events."""
+    """Custom TCP client for Wyoming events.
+
+    Callbacks are registered by event type, so events without a callback,
+    such as audio chunks, are sent and received without any extra awaits.
+    """
 
     def __init__(
         self,
         host: str,
         port: int,
-        before_send_callback=None,
-        after_send_callback=None,
-        on_receive_callback=None,
+        before_send_callbacks: dict[str, EventCallback] | None = None,
+        after_send_callbacks: dict[str, EventCallback] | None = None,
+        on_receive_callbacks: dict[str, EventCallback] | None = None,
     ) -> None:
         """Initialize the custom TCP client."""
         super().__init__(host, port)
-        self._before_send_callback = before_send_callback
-        self._after_send_callback = after_send_callback
-        self._on_receive_callback = on_receive_callback
+        self._before_send_callbacks = before_send_callbacks or {}
+        self._after_send_callbacks = after_send_callbacks or {}
+        self._on_receive_callbacks = on_receive_callbacks or {}
 
     async def write_event(self, event: Event) -> None:
         """Write an event to the server."""
-        if self._before_send_callback:
-            await self._before_send_callback(event)
+        if before_send_callback := self._before_send_callbacks.get(event.type):
+            await before_send_callback(event)
         if self.can_write_event():
             await super().write_event(event)
-        if self._after_send_callback:
-            await self._after_send_callback(event)
+        if after_send_callback := self._after_send_callbacks.get(event.type):
+            await after_send_callback(event)
 
     async def read_event(self) -> Event:
         """Read an event from the server."""
         event = await super().read_event()
-        if self._on_receive_callback:
-            await self._on_receive_callback(event)
+        if event is not None and (
+            on_receive_callback := self._on_receive_callbacks.get(event.type)
+        ):
+            await on_receive_callback(event)
         return event
 
     def can_write_event(self) -> bool:
         """Check if the client can write an event."""
         return self._writer is not None and not self._writer.is_closing()
+
+    def batch(
+        self,
+        max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
+        max_delay: float = DEFAULT_BATCH_MAX_DELAY,
+    ) -> "EventBatch":
+        """Return a batch to queue events and write them together."""
+        return EventBatch(self, max_bytes, max_delay)
+
+    def has_callbacks(self, event_type: str) -> bool:
+        """Return True if any callbacks are registered for an event type."""
+        return (
+            event_type in self._before_send_callbacks
+            or event_type in self._after_send_callbacks
+        )
+
+    async def write_bytes(self, data: Iterable[bytes]) -> None:
+        """Write already serialized events to the server."""
+        if self.can_write_event():
+            self._writer.writelines(data)
+            await self._writer.drain()
+
+
+class EventBatch:
+    """Queue of events written to the socket with a single drain.
+
+    Events are flushed once the queue reaches max_bytes, when an event is
+    added more than max_delay seconds after the first queued one, and on
+    exit.  Callers streaming from a slower source should also flush before
+    waiting for more data.
+    """
+
+    def __init__(
+        self, client: VAAsyncTcpClient, max_bytes: int, max_delay: float
+    ) -> None:
+        """Initialise batch."""
+        self._client = client
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self._data: list[bytes] = []
+        self._size = 0
+        self._first_queued = 0.0
+        self.events = 0
+        self.flushes = 0
+
+    async def __aenter__(self) -> Self:
+        """Start batch."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Write any queued events."""
+        await self.flush()
+
+    async def write_event(self, event: Event) -> None:
+        """Queue an event, writing the queue if it is full or old enough."""
+        if self._client.has_callbacks(event.type):
+            # Keep callbacks in order with the events around them
+            await self.flush()
+            await self._client.write_event(event)
+            return
+
+        if not self._data:
+            self._first_queued = time.monotonic()
+
+        # Use the wyoming serializer, with this batch in place of the writer
+        await async_write_event(event, self)
+        self.events += 1
+
+        if (
+            self._size >= self.max_bytes
+            or (time.monotonic() - self._first_queued) >= self.max_delay
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all queued events."""
+        if not self._data:
+            return
+
+        data = self._data
+        self._data = []
+        self._size = 0
+        self.flushes += 1
+        await self._client.write_bytes(data)
+
+    def write(self, data: bytes) -> None:
+        """Queue serialized event data."""
+        self._data.append(data)
+        self._size += len(data)
+
+    def writelines(self, data: Iterable[bytes]) -> None:
+        """Queue serialized event data."""
+        for item in data:
+            self.write(item)
+
+    async def drain(self) -> None:
+        """Do nothing, as data is written on flush."""
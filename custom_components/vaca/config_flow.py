@@ -3,14 +3,213 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
+
+import voluptuous as vol
 
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.wyoming.config_flow import WyomingConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlowResult, OptionsFlow
+from homeassistant.const import CONF_HOST, CONF_PORT, Platform
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    TextSelector,
+    TextSelectorConfig,
+)
+from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
-from .const import DOMAIN
+from .const import (
+    CONF_AUDIO_LEAD_SECONDS,
+    CONF_INTENT_ATTRIBUTES,
+    CONF_INTENT_ATTRIBUTES_MAX_BYTES,
+    CONF_RECONNECT_MAX_SECONDS,
+    CONF_RECONNECT_MIN_SECONDS,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MAX_AGE,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_RELATIVE_DEADBAND,
+    CONF_STT_FRAME_MS,
+    CONF_STT_PARTIAL_INTERVAL,
+    CONF_TTS_CACHE_DISK_MAX_BYTES,
+    CONF_TTS_CACHE_MAX_BYTES,
+    DEFAULT_AUDIO_LEAD_SECONDS,
+    DEFAULT_INTENT_ATTRIBUTES,
+    DEFAULT_INTENT_ATTRIBUTES_MAX_BYTES,
+    DEFAULT_RECONNECT_MAX_SECONDS,
+    DEFAULT_RECONNECT_MIN_SECONDS,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_MAX_AGE,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_SENSOR_RELATIVE_DEADBAND,
+    DEFAULT_STT_FRAME_MS,
+    DEFAULT_STT_PARTIAL_INTERVAL,
+    DEFAULT_TTS_CACHE_DISK_MAX_BYTES,
+    DEFAULT_TTS_CACHE_MAX_BYTES,
+    DOMAIN,
+)
+from .models import VADomainDataItem
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _number(
+    minimum: float, maximum: float, step: float = 1, unit: str | None = None
+) -> NumberSelector:
+    """Return a number box selector, which also validates the range."""
+    return NumberSelector(
+        NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=step,
+            unit_of_measurement=unit,
+            mode=NumberSelectorMode.BOX,
+        )
+    )
+
+
+def _integer(minimum: int, maximum: int, unit: str | None = None) -> vol.All:
+    """Return a number box selector for whole numbers."""
+    return vol.All(_number(minimum, maximum, unit=unit), vol.Coerce(int))
+
+
+# Options of the STT, TTS and wake word services of an entry
+TTS_OPTIONS: dict[str, tuple[Any, Any]] = {
+    CONF_TTS_CACHE_MAX_BYTES: (
+        DEFAULT_TTS_CACHE_MAX_BYTES,
+        _integer(0, 1024 * 1024 * 1024, "B"),
+    ),
+    CONF_TTS_CACHE_DISK_MAX_BYTES: (
+        DEFAULT_TTS_CACHE_DISK_MAX_BYTES,
+        _integer(0, 10 * 1024 * 1024 * 1024, "B"),
+    ),
+}
+STT_OPTIONS: dict[str, tuple[Any, Any]] = {
+    CONF_STT_FRAME_MS: (DEFAULT_STT_FRAME_MS, _integer(0, 1000, "ms")),
+}
+
+# Options of a satellite entry
+SATELLITE_OPTIONS: dict[str, tuple[Any, Any]] = {
+    CONF_AUDIO_LEAD_SECONDS: (DEFAULT_AUDIO_LEAD_SECONDS, _number(0, 30, 0.1, "s")),
+    CONF_STT_PARTIAL_INTERVAL: (
+        DEFAULT_STT_PARTIAL_INTERVAL,
+        _number(0, 10, 0.1, "s"),
+    ),
+    CONF_SENSOR_DEADBAND: (DEFAULT_SENSOR_DEADBAND, _number(0, 1000, 0.1)),
+    CONF_SENSOR_RELATIVE_DEADBAND: (
+        DEFAULT_SENSOR_RELATIVE_DEADBAND,
+        _number(0, 1, 0.01),
+    ),
+    CONF_SENSOR_MIN_INTERVAL: (DEFAULT_SENSOR_MIN_INTERVAL, _number(0, 3600, 0.1, "s")),
+    CONF_SENSOR_MAX_AGE: (DEFAULT_SENSOR_MAX_AGE, _integer(0, 86400, "s")),
+    CONF_INTENT_ATTRIBUTES: (
+        DEFAULT_INTENT_ATTRIBUTES,
+        TextSelector(TextSelectorConfig(multiple=True)),
+    ),
+    # State attributes over 16 KiB are not recorded
+    CONF_INTENT_ATTRIBUTES_MAX_BYTES: (
+        DEFAULT_INTENT_ATTRIBUTES_MAX_BYTES,
+        _integer(256, 16384, "B"),
+    ),
+    CONF_RECONNECT_MIN_SECONDS: (
+        DEFAULT_RECONNECT_MIN_SECONDS,
+        _number(0.1, 60, 0.1, "s"),
+    ),
+    CONF_RECONNECT_MAX_SECONDS: (
+        DEFAULT_RECONNECT_MAX_SECONDS,
+        _number(1, 3600, 1, "s"),
+    ),
+}
+
+
 class VAWyomingConfigFlow(WyomingConfigFlow, domain=DOMAIN):
     """Handle a config flow for Wyoming integration."""
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return VAOptionsFlow()
+
+    async def async_step_zeroconf(
+        self, discovery_info: ZeroconfServiceInfo
+    ) -> ConfigFlowResult:
+        """Handle zeroconf discovery.
+
+        A satellite that is already configured is told straight away, so it
+        can reconnect without waiting for its backoff, and its address is
+        updated in place if it has moved.
+        """
+        if discovery_info.port is not None:
+            # Unique id is the zeroconf name + service name
+            prefix = f"{discovery_info.name}_"
+            for entry in self._async_current_entries(include_ignore=False):
+                if not (entry.unique_id or "").startswith(prefix):
+                    continue
+
+                host, port = discovery_info.host, discovery_info.port
+                async_dispatcher_send(
+                    self.hass, f"{DOMAIN}_{entry.entry_id}_discovered", host, port
+                )
+                if (entry.data.get(CONF_HOST), entry.data.get(CONF_PORT)) != (
+                    host,
+                    port,
+                ):
+                    _LOGGER.debug(
+                        "Updating address of %s to %s:%s", entry.title, host, port
+                    )
+                    self.hass.config_entries.async_update_entry(
+                        entry, data={**entry.data, CONF_HOST: host, CONF_PORT: port}
+                    )
+                return self.async_abort(reason="already_configured")
+
+        return await super().async_step_zeroconf(discovery_info)
+
+
+class VAOptionsFlow(OptionsFlow):
+    """Handle options of a satellite or service entry."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            if user_input.get(
+                CONF_RECONNECT_MAX_SECONDS, DEFAULT_RECONNECT_MAX_SECONDS
+            ) < user_input.get(
+                CONF_RECONNECT_MIN_SECONDS, DEFAULT_RECONNECT_MIN_SECONDS
+            ):
+                errors[CONF_RECONNECT_MAX_SECONDS] = "reconnect_range"
+            else:
+                return self.async_create_entry(data=user_input)
+
+        options = self.config_entry.options
+        schema = {
+            vol.Optional(key, default=options.get(key, default)): selector
+            for key, (default, selector) in self._options().items()
+        }
+        return self.async_show_form(
+            step_id="init", data_schema=vol.Schema(schema), errors=errors
+        )
+
+    def _options(self) -> dict[str, tuple[Any, Any]]:
+        """Return the options that apply to the entry."""
+        item: VADomainDataItem | None = self.hass.data.get(DOMAIN, {}).get(
+            self.config_entry.entry_id
+        )
+        if item is None:
+            # Entry is not loaded, so its services are not known
+            return {**SATELLITE_OPTIONS, **STT_OPTIONS, **TTS_OPTIONS}
+
+        options: dict[str, tuple[Any, Any]] = {}
+        if item.device is not None:
+            options.update(SATELLITE_OPTIONS)
+        if Platform.STT in item.service.platforms:
+            options.update(STT_OPTIONS)
+        if Platform.TTS in item.service.platforms:
+            options.update(TTS_OPTIONS)
+        return options
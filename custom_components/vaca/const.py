@@ -10,3 +10,67 @@ SAMPLE_CHANNELS = 1
 ATTR_SPEAKER = "speaker"
 
 INTENT_EVENT = f"{DOMAIN}_intent_event"
+
+# Resources shared by all config entries
+DATA_HUB = f"{DOMAIN}_hub"
+HUB_MAX_DECODES = 2  # concurrent in-process audio conversions
+
+# Services
+SERVICE_BROADCAST = "broadcast"
+DEFAULT_BROADCAST_TIMEOUT = 120  # seconds for each satellite
+
+# Connection pool for STT and TTS services
+POOL_MAX_SIZE = 4
+POOL_IDLE_TIMEOUT = 60
+POOL_WAIT_TIMEOUT = 30  # seconds to wait for a free connection
+
+# TTS audio spilled to disk, in a directory per config entry
+TTS_CACHE_DIR = f"{DOMAIN}_tts_cache"
+
+# Options
+CONF_TTS_CACHE_MAX_BYTES = "tts_cache_max_bytes"
+CONF_TTS_CACHE_DISK_MAX_BYTES = "tts_cache_disk_max_bytes"
+CONF_AUDIO_LEAD_SECONDS = "audio_lead_seconds"
+CONF_SENSOR_DEADBAND = "sensor_deadband"
+CONF_SENSOR_RELATIVE_DEADBAND = "sensor_relative_deadband"
+CONF_SENSOR_MIN_INTERVAL = "sensor_min_interval"
+CONF_SENSOR_MAX_AGE = "sensor_max_age"
+CONF_INTENT_ATTRIBUTES = "intent_attributes"
+CONF_STT_PARTIAL_INTERVAL = "stt_partial_interval"
+CONF_STT_FRAME_MS = "stt_frame_ms"
+CONF_INTENT_ATTRIBUTES_MAX_BYTES = "intent_attributes_max_bytes"
+CONF_RECONNECT_MIN_SECONDS = "reconnect_min_seconds"
+CONF_RECONNECT_MAX_SECONDS = "reconnect_max_seconds"
+
+DEFAULT_TTS_CACHE_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_TTS_CACHE_DISK_MAX_BYTES = 0  # Disabled
+DEFAULT_AUDIO_LEAD_SECONDS = 2.0  # 0 to send audio as fast as possible
+DEFAULT_SENSOR_DEADBAND = 2  # lux
+DEFAULT_SENSOR_RELATIVE_DEADBAND = 0.05
+DEFAULT_SENSOR_MIN_INTERVAL = 1.0  # seconds
+DEFAULT_SENSOR_MAX_AGE = 300  # seconds, 0 for no heartbeat
+# Dot notation paths of intent end data kept as intent sensor attributes
+DEFAULT_INTENT_ATTRIBUTES = [
+    "processed_locally",
+    "intent_output.conversation_id",
+    "intent_output.continue_conversation",
+    "intent_output.response.response_type",
+    "intent_output.response.language",
+    "intent_output.response.speech.plain.speech",
+    "intent_output.response.data.code",
+    "intent_output.response.data.targets",
+    "intent_output.response.data.success",
+    "intent_output.response.data.failed",
+]
+DEFAULT_INTENT_ATTRIBUTES_MAX_BYTES = 4096
+DEFAULT_STT_PARTIAL_INTERVAL = 0.3  # seconds between partial transcript updates
+DEFAULT_STT_FRAME_MS = 100  # mic audio sent to ASR in frames of this, 0 to disable
+DEFAULT_RECONNECT_MIN_SECONDS = 1.0  # first delay, doubled after each failure
+DEFAULT_RECONNECT_MAX_SECONDS = 60.0
+
+# Voice pipeline latency stages
+LATENCY_STT = "stt"
+LATENCY_INTENT = "intent"
+LATENCY_TTS = "tts"
+LATENCY_RESPONSE = "response"
+LATENCY_PLAYBACK = "playback"
@@ -10,8 +10,13 @@ from wyoming.event import Event, Eventable
 _LOGGER = logging.getLogger(__name__)
 
 _CUSTOM_SETTINGS_TYPE = "custom-settings"
+_CUSTOM_SETTINGS_DELTA_TYPE = "custom-settings-delta"
+_CUSTOM_SETTINGS_RESYNC_TYPE = "custom-settings-resync"
 _CUSTOM_ACTION_TYPE = "custom-action"
 
+# Advertised in satellite info by apps that can apply settings deltas
+SETTINGS_DELTA_CAPABILITY = "settings-delta"
+
 
 @dataclass
 class CustomSettings(Eventable):
@@ -20,6 +25,9 @@ class CustomSettings(Eventable):
     settings: dict[str, Any]
     """Text to copy to response."""
 
+    version: int | None = None
+    """Version of the settings, used to apply later deltas."""
+
     @staticmethod
     def is_type(event_type: str) -> bool:
         """Check if the event type is a custom settings event."""
@@ -27,15 +35,75 @@ class CustomSettings(Eventable):
 
     def event(self) -> Event:
         """Create an event for custom settings."""
-        return Event(
-            type=_CUSTOM_SETTINGS_TYPE,
-            data={"settings": self.settings},
-        )
+        data: dict[str, Any] = {"settings": self.settings}
+        if self.version is not None:
+            data["version"] = self.version
+        return Event(type=_CUSTOM_SETTINGS_TYPE, data=data)
 
     @staticmethod
     def from_event(event: Event) -> "CustomSettings":
         """Create a CustomSettings instance from an event."""
-        return CustomSettings(settings=event.data.get("settings"))
+        return CustomSettings(
+            settings=event.data.get("settings"), version=event.data.get("version")
+        )
+
+
+@dataclass
+class CustomSettingsDelta(Eventable):
+    """Custom settings changed since the previous version."""
+
+    version: int
+    """Version of the settings after applying the changes."""
+
+    changes: dict[str, Any]
+    """Changed settings."""
+
+    @staticmethod
+    def is_type(event_type: str) -> bool:
+        """Check if the event type is a custom settings delta event."""
+        return event_type == _CUSTOM_SETTINGS_DELTA_TYPE
+
+    def event(self) -> Event:
+        """Create an event for custom settings delta."""
+        return Event(
+            type=_CUSTOM_SETTINGS_DELTA_TYPE,
+            data={"version": self.version, "changes": self.changes},
+        )
+
+    @staticmethod
+    def from_event(event: Event) -> "CustomSettingsDelta":
+        """Create a CustomSettingsDelta instance from an event."""
+        return CustomSettingsDelta(
+            version=event.data.get("version"), changes=event.data.get("changes")
+        )
+
+
+@dataclass
+class CustomSettingsResync(Eventable):
+    """Request from the satellite for all custom settings.
+
+    Sent when a delta does not follow on from the version the satellite has.
+    """
+
+    version: int | None = None
+    """Last version of the settings the satellite applied."""
+
+    @staticmethod
+    def is_type(event_type: str) -> bool:
+        """Check if the event type is a custom settings resync event."""
+        return event_type == _CUSTOM_SETTINGS_RESYNC_TYPE
+
+    def event(self) -> Event:
+        """Create an event for custom settings resync."""
+        return Event(
+            type=_CUSTOM_SETTINGS_RESYNC_TYPE,
+            data={"version": self.version},
+        )
+
+    @staticmethod
+    def from_event(event: Event) -> "CustomSettingsResync":
+        """Create a CustomSettingsResync instance from an event."""
+        return CustomSettingsResync(version=event.data.get("version"))
 
 
 class CustomActions(StrEnum):
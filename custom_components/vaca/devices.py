@@ -3,19 +3,88 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from homeassistant.components.wyoming import SatelliteDevice
 from homeassistant.components.wyoming.data import Info
 from homeassistant.core import callback
 
+from .backoff import ReconnectBackoff
+from .limiter import StateWriteLimiter
+from .metrics import LinkQuality, RollingStats
+
+StatusListener = Callable[[Any], None]
+
+
+class StatusRouter:
+    """Route satellite custom status sensor values to registered listeners.
+
+    Each status event is parsed once and only listeners of the sensor keys
+    whose value changed are called, so the cost of an event does not grow
+    with the number of status sensors.
+    """
+
+    def __init__(self) -> None:
+        """Initialise router."""
+        self._listeners: dict[str, list[StatusListener]] = {}
+        self._values: dict[str, Any] = {}
+        self.events = 0
+        self.calls = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return routing statistics."""
+        return {
+            "events": self.events,
+            "calls": self.calls,
+            "keys": sorted(self._listeners),
+        }
+
+    @callback
+    def async_register(self, key: str, listener: StatusListener) -> Callable[[], None]:
+        """Register a listener for a sensor key and return a remove callback.
+
+        The last value received for the key, if any, is passed on straight away.
+        """
+        listeners = self._listeners.setdefault(key, [])
+        listeners.append(listener)
+        if key in self._values:
+            listener(self._values[key])
+
+        @callback
+        def _remove() -> None:
+            listeners.remove(listener)
+            if not listeners:
+                del self._listeners[key]
+
+        return _remove
+
+    @callback
+    def async_route(self, data: dict[str, Any] | None) -> None:
+        """Route the sensor values of a custom status event."""
+        self.events += 1
+        if not data or not (sensors := data.get("sensors")):
+            return
+
+        values = self._values
+        for key, value in sensors.items():
+            if key in values and values[key] == value:
+                continue
+            values[key] = value
+            if listeners := self._listeners.get(key):
+                for listener in listeners:
+                    self.calls += 1
+                    listener(value)
+
 
 @dataclass
 class VASatelliteDevice(SatelliteDevice):
     """VACA Class to store device."""
 
     info: Info | None = None
+    # Incremented when info changes, so entities can cache values from it
+    info_revision: int = 0
     custom_settings: dict[str, Any] | None = None
 
     _custom_settings_listener: Callable[[], None] | None = None
@@ -23,6 +92,49 @@ class VASatelliteDevice(SatelliteDevice):
     stt_listener: Callable[[str], None] | None = None
     tts_listener: Callable[[str], None] | None = None
 
+    # Counts of setting changes and settings events sent to the satellite
+    custom_settings_changes: int = 0
+    custom_settings_pushes: int = 0
+
+    # Pacing of the last audio streamed to the satellite
+    audio_pacing_stats: dict[str, Any] | None = None
+
+    # Voice pipeline stage latencies in milliseconds
+    latency: dict[str, RollingStats] = field(default_factory=dict)
+
+    # Round trip times and loss of pings to the satellite
+    link_quality: LinkQuality = field(default_factory=LinkQuality)
+
+    # State write limiters of sensors fed by custom status updates
+    state_write_limiters: dict[str, StateWriteLimiter] = field(default_factory=dict)
+
+    # Serialized size in bytes of the last intent data and its attributes
+    intent_attribute_stats: dict[str, int] | None = None
+
+    # Routes custom status sensor values to entities
+    status_router: StatusRouter = field(default_factory=StatusRouter)
+
+    # Backoff between attempts to reconnect to the satellite
+    reconnect_backoff: ReconnectBackoff | None = None
+
+    @property
+    def custom_settings_stats(self) -> dict[str, int]:
+        """Return custom settings push statistics."""
+        return {
+            "changes": self.custom_settings_changes,
+            "pushes": self.custom_settings_pushes,
+            "saved": max(0, self.custom_settings_changes - self.custom_settings_pushes),
+        }
+
+    @callback
+    def set_info(self, info: Info) -> None:
+        """Set satellite info."""
+        if info == self.info:
+            return
+
+        self.info = info
+        self.info_revision += 1
+
     @callback
     def set_custom_setting(self, setting: str, value: str | float) -> None:
         """Set custom setting."""
@@ -36,6 +148,7 @@ class VASatelliteDevice(SatelliteDevice):
         else:
             self.custom_settings[setting] = value
 
+        self.custom_settings_changes += 1
         if self._custom_settings_listener is not None:
             self._custom_settings_listener()
 
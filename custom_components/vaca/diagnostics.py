@@ -0,0 +1,59 @@
+"""Diagnostics support for View Assist Companion App."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .hub import async_get_hub
+from .models import VADomainDataItem
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    item: VADomainDataItem = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "info": item.service.info.to_dict(),
+        "pool": item.pool.stats if item.pool is not None else None,
+        "tts_cache": item.tts_cache.stats if item.tts_cache is not None else None,
+        "custom_settings": (
+            item.device.custom_settings_stats if item.device is not None else None
+        ),
+        "audio_pacing": (
+            item.device.audio_pacing_stats if item.device is not None else None
+        ),
+        "intent_attributes": (
+            item.device.intent_attribute_stats if item.device is not None else None
+        ),
+        "status_router": (
+            item.device.status_router.stats if item.device is not None else None
+        ),
+        "state_writes": (
+            {
+                key: limiter.stats
+                for key, limiter in item.device.state_write_limiters.items()
+            }
+            if item.device is not None
+            else None
+        ),
+        "link_quality": (
+            item.device.link_quality.as_dict() if item.device is not None else None
+        ),
+        "reconnect": (
+            item.device.reconnect_backoff.stats
+            if item.device is not None and item.device.reconnect_backoff is not None
+            else None
+        ),
+        "latency": (
+            {stage: stats.as_dict() for stage, stats in item.device.latency.items()}
+            if item.device is not None
+            else None
+        ),
+        "fleet": async_get_hub(hass).stats,
+    }
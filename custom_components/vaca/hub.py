@@ -0,0 +1,173 @@
+"""Resources shared by all View Assist config entries."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .cache import AudioCache
+from .const import (
+    DATA_HUB,
+    HUB_MAX_DECODES,
+    POOL_IDLE_TIMEOUT,
+    POOL_MAX_SIZE,
+    POOL_WAIT_TIMEOUT,
+)
+from .devices import VASatelliteDevice
+from .info_cache import InfoCache
+from .metrics import RollingStats
+from .pool import WyomingConnectionPool
+
+if TYPE_CHECKING:
+    from .assist_satellite import ViewAssistSatelliteEntity
+
+_PREANNOUNCE_CACHE_MAX_BYTES: Final = 2 * 1024 * 1024  # ~47s of audio
+_PREANNOUNCE_CACHE_MAX_ENTRIES: Final = 8
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> VACAHub:
+    """Return the hub, creating it if needed."""
+    if (hub := hass.data.get(DATA_HUB)) is None:
+        hub = hass.data[DATA_HUB] = VACAHub(hass)
+    return hub
+
+
+class VACAHub:
+    """Owner of resources shared by all satellites and services.
+
+    Satellites nearly always play the same preannounce sounds, so decoded
+    audio is cached once for the fleet.  Connection pools are shared by
+    entries for the same service and pruned by a single timer, and in
+    process audio conversions are limited across the fleet so a burst of
+    announcements does not fill the executor.  Info of all entries is kept
+    in a single store, so startup reads one file.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise hub."""
+        self.hass = hass
+        self.preannounce_cache = AudioCache(
+            hass,
+            "preannounce",
+            max_bytes=_PREANNOUNCE_CACHE_MAX_BYTES,
+            max_entries=_PREANNOUNCE_CACHE_MAX_ENTRIES,
+        )
+        self.decode_semaphore = asyncio.Semaphore(HUB_MAX_DECODES)
+        self.info_cache = InfoCache(hass)
+        self.satellites: dict[str, VASatelliteDevice] = {}
+        # Satellite entities by entity id, for broadcasts
+        self.announcers: dict[str, ViewAssistSatelliteEntity] = {}
+
+        self._pools: dict[tuple[str, int], WyomingConnectionPool] = {}
+        self._pool_entries: dict[tuple[str, int], set[str]] = {}
+        self._unsub_prune: Callable[[], None] | None = None
+
+    @callback
+    def async_acquire_pool(
+        self, entry_id: str, host: str, port: int
+    ) -> WyomingConnectionPool:
+        """Return the connection pool for a service, creating it if needed."""
+        key = (host, port)
+        if (pool := self._pools.get(key)) is None:
+            pool = self._pools[key] = WyomingConnectionPool(
+                self.hass,
+                host,
+                port,
+                max_size=POOL_MAX_SIZE,
+                idle_timeout=POOL_IDLE_TIMEOUT,
+                wait_timeout=POOL_WAIT_TIMEOUT,
+            )
+            pool.warm_up()
+        self._pool_entries.setdefault(key, set()).add(entry_id)
+
+        if self._unsub_prune is None:
+            self._unsub_prune = async_track_time_interval(
+                self.hass, self._prune_pools, timedelta(seconds=POOL_IDLE_TIMEOUT)
+            )
+        return pool
+
+    async def async_release_pool(self, entry_id: str, host: str, port: int) -> None:
+        """Release a pool, closing it when no entry uses it."""
+        key = (host, port)
+        entries = self._pool_entries.get(key, set())
+        entries.discard(entry_id)
+        if entries:
+            return
+
+        self._pool_entries.pop(key, None)
+        if (pool := self._pools.pop(key, None)) is not None:
+            await pool.async_close()
+        if not self._pools and self._unsub_prune is not None:
+            self._unsub_prune()
+            self._unsub_prune = None
+
+    @callback
+    def async_register_satellite(
+        self, entry_id: str, device: VASatelliteDevice
+    ) -> Callable[[], None]:
+        """Register a satellite device and return a remove callback."""
+        self.satellites[entry_id] = device
+
+        @callback
+        def _remove() -> None:
+            if self.satellites.get(entry_id) is device:
+                del self.satellites[entry_id]
+
+        return _remove
+
+    @callback
+    def async_register_announcer(
+        self, entity: ViewAssistSatelliteEntity
+    ) -> Callable[[], None]:
+        """Register a satellite entity that can play broadcasts."""
+        entity_id = entity.entity_id
+        self.announcers[entity_id] = entity
+
+        @callback
+        def _remove() -> None:
+            if self.announcers.get(entity_id) is entity:
+                del self.announcers[entity_id]
+
+        return _remove
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return fleet statistics."""
+        devices = list(self.satellites.values())
+        stages = {stage for device in devices for stage in device.latency}
+        return {
+            "satellites": len(devices),
+            "pools": {
+                f"{host}:{port}": {
+                    **pool.stats,
+                    "entries": len(self._pool_entries.get((host, port), ())),
+                }
+                for (host, port), pool in self._pools.items()
+            },
+            "preannounce_cache": self.preannounce_cache.stats,
+            "info_cache": self.info_cache.stats,
+            "custom_settings": {
+                key: sum(device.custom_settings_stats[key] for device in devices)
+                for key in ("changes", "pushes", "saved")
+            },
+            "latency": {
+                stage: RollingStats.combine(
+                    device.latency[stage]
+                    for device in devices
+                    if stage in device.latency
+                ).as_dict()
+                for stage in sorted(stages)
+            },
+        }
+
+    @callback
+    def _prune_pools(self, _now: datetime) -> None:
+        """Close idle connections of all pools."""
+        for pool in self._pools.values():
+            pool.prune()
@@ -0,0 +1,150 @@
+"""Persistent cache of the info last received from each service."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Final
+
+from wyoming.event import Event
+from wyoming.info import Info
+
+from homeassistant.components.wyoming import WyomingService
+
+# pylint: disable-next=hass-component-root-import
+from homeassistant.components.wyoming.data import load_wyoming_info
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY: Final = f"{DOMAIN}.info"
+STORAGE_VERSION: Final = 1
+
+_SAVE_DELAY: Final = 10
+_INFO_TYPE: Final = Info().event().type
+
+
+class InfoCache:
+    """Info last received from the service of each config entry.
+
+    Entries are set up from cached info, so Home Assistant does not wait at
+    startup for satellites that are asleep or slow to answer.  Info is
+    updated when the service next answers, and saved in the background.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise cache."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._data: dict[str, dict[str, Any]] | None = None
+        self._load_lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return cache statistics."""
+        return {
+            "entries": len(self._data or {}),
+            "hits": self.hits,
+            "misses": self.misses,
+            "updates": self.updates,
+        }
+
+    async def async_get(self, entry_id: str) -> Info | None:
+        """Return cached info for an entry."""
+        data = await self._async_load()
+        if (info_data := data.get(entry_id)) is None:
+            self.misses += 1
+            return None
+
+        try:
+            info = Info.from_event(Event(type=_INFO_TYPE, data=info_data))
+        except (KeyError, TypeError, ValueError) as ex:
+            _LOGGER.debug("Ignoring invalid cached info for %s: %s", entry_id, ex)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return info
+
+    @callback
+    def async_set(self, entry_id: str, info: Info) -> None:
+        """Cache info for an entry, saving it after a delay."""
+        if self._data is None:
+            # Only entries set up after the cache was loaded can be updated
+            return
+
+        info_data = info.to_dict()
+        if self._data.get(entry_id) == info_data:
+            return
+
+        self._data[entry_id] = info_data
+        self.updates += 1
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    async def async_remove(self, entry_id: str) -> None:
+        """Remove cached info of a removed entry."""
+        data = await self._async_load()
+        if data.pop(entry_id, None) is not None:
+            self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    async def _async_load(self) -> dict[str, dict[str, Any]]:
+        """Load cached info once."""
+        async with self._load_lock:
+            if self._data is None:
+                self._data = await self._store.async_load() or {}
+        return self._data
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return data to save."""
+        return self._data or {}
+
+
+async def async_create_service(
+    hass: HomeAssistant, entry: ConfigEntry, cache: InfoCache
+) -> WyomingService | None:
+    """Create the service of an entry, from cached info if there is any.
+
+    With cached info the service is returned straight away.  Info of a
+    satellite is refreshed when it connects, and info of other services is
+    loaded in the background, reloading the entry if it has changed.
+    """
+    host, port = entry.data[CONF_HOST], entry.data[CONF_PORT]
+    if (info := await cache.async_get(entry.entry_id)) is None:
+        if (service := await WyomingService.create(host, port)) is not None:
+            cache.async_set(entry.entry_id, service.info)
+        return service
+
+    service = WyomingService(host, port, info)
+    if info.satellite is None:
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_info(hass, entry, service, cache),
+            "vaca info refresh",
+        )
+    return service
+
+
+async def _async_refresh_info(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    service: WyomingService,
+    cache: InfoCache,
+) -> None:
+    """Load info of a service set up from the cache."""
+    info = await load_wyoming_info(service.host, service.port)
+    if info is None or info == service.info:
+        return
+
+    _LOGGER.debug("Info of %s has changed, reloading", entry.title)
+    cache.async_set(entry.entry_id, info)
+    hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -0,0 +1,108 @@
+"""State write limiting for sensors fed by satellite status updates."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class StateWriteLimiter:
+    """Decide when a new sensor value is worth writing to the state machine.
+
+    Numeric values that stay within the absolute or relative deadband of the
+    last written value are dropped, and no value is written sooner than
+    min_interval after the last write.  A value held back by the deadband is
+    still written once max_age has passed, so the state never drifts from
+    the satellite for longer than that.
+    """
+
+    def __init__(
+        self,
+        deadband: float = 0,
+        relative_deadband: float = 0,
+        min_interval: float = 0,
+        max_age: float = 0,
+    ) -> None:
+        """Initialise limiter."""
+        self.deadband = deadband
+        self.relative_deadband = relative_deadband
+        self.min_interval = min_interval
+        self.max_age = max_age
+
+        self._value: Any = None
+        self._written_at: float | None = None
+
+        # Set when the last value offered was held back by min_interval
+        self.held_back = False
+        # Set when the last value offered was held back by the deadband but
+        # differs from the written value
+        self.drifted = False
+
+        self.writes = 0
+        self.heartbeats = 0
+        self.suppressed_deadband = 0
+        self.suppressed_interval = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return write statistics."""
+        return {
+            "writes": self.writes,
+            "heartbeats": self.heartbeats,
+            "suppressed_deadband": self.suppressed_deadband,
+            "suppressed_interval": self.suppressed_interval,
+        }
+
+    def next_write(self) -> float | None:
+        """Return when a value held back by min_interval may be written."""
+        if self._written_at is None:
+            return None
+        return self._written_at + self.min_interval
+
+    def next_heartbeat(self) -> float | None:
+        """Return when a value held back by the deadband must be written."""
+        if self._written_at is None or not self.max_age:
+            return None
+        return self._written_at + self.max_age
+
+    def should_write(self, value: Any, now: float) -> bool:
+        """Return if value should be written now, and record it if so."""
+        if self._written_at is None:
+            self._record(value, now)
+            return True
+
+        age = now - self._written_at
+        self.held_back = False
+        self.drifted = False
+        if self._within_deadband(value):
+            if not self.max_age or age < self.max_age:
+                self.suppressed_deadband += 1
+                self.drifted = value != self._value
+                return False
+            self.heartbeats += 1
+        elif age < self.min_interval:
+            self.suppressed_interval += 1
+            self.held_back = True
+            return False
+
+        self._record(value, now)
+        return True
+
+    def _record(self, value: Any, now: float) -> None:
+        """Record a written value."""
+        self._value = value
+        self._written_at = now
+        self.writes += 1
+
+    def _within_deadband(self, value: Any) -> bool:
+        """Return if value is not a significant change from the last written."""
+        if value == self._value:
+            return True
+        if not isinstance(value, (int, float)) or not isinstance(
+            self._value, (int, float)
+        ):
+            return False
+
+        delta = abs(value - self._value)
+        return delta <= self.deadband or delta <= self.relative_deadband * abs(
+            self._value
+        )
@@ -0,0 +1,147 @@
+"""Rolling latency and link statistics for View Assist satellites."""
+
+from __future__ import annotations
+
+import bisect
+from collections import deque
+from collections.abc import Iterable
+import math
+from typing import Any
+
+DEFAULT_MAX_SAMPLES = 100
+
+# Upper bounds in milliseconds of ping round trip time histogram buckets
+RTT_HISTOGRAM_BOUNDS: tuple[int, ...] = (10, 20, 50, 100, 200, 500, 1000)
+
+# Gain of the smoothed jitter estimate, as used by RFC 3550
+_JITTER_GAIN = 1 / 16
+
+
+class RollingStats:
+    """Statistics over the most recent samples of a measurement."""
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """Initialise stats."""
+        self._samples: deque[float] = deque(maxlen=max_samples)
+        self.last: float | None = None
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add a sample."""
+        self._samples.append(value)
+        self.last = value
+        self.count += 1
+
+    @classmethod
+    def combine(cls, stats: Iterable[RollingStats]) -> RollingStats:
+        """Return stats over the recent samples of several measurements."""
+        stats = list(stats)
+        combined = cls(max(1, sum(len(item._samples) for item in stats)))
+        for item in stats:
+            combined._samples.extend(item._samples)
+            combined.count += item.count
+        return combined
+
+    def percentile(self, percent: float) -> float | None:
+        """Return a percentile of the recent samples, by nearest rank."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = max(0, math.ceil(len(ordered) * percent / 100) - 1)
+        return ordered[index]
+
+    def histogram(self, bounds: Iterable[float]) -> dict[str, int]:
+        """Return counts of the recent samples below each bound and above all."""
+        bounds = sorted(bounds)
+        counts = dict.fromkeys([f"<{bound}" for bound in bounds], 0)
+        over = 0
+        for value in self._samples:
+            index = bisect.bisect_right(bounds, value)
+            if index < len(bounds):
+                counts[f"<{bounds[index]}"] += 1
+            else:
+                over += 1
+        if bounds:
+            counts[f">={bounds[-1]}"] = over
+        return counts
+
+    def as_dict(self, digits: int = 1) -> dict[str, Any]:
+        """Return last value, percentiles and count."""
+        return {
+            "last": _round(self.last, digits),
+            "p50": _round(self.percentile(50), digits),
+            "p95": _round(self.percentile(95), digits),
+            "p99": _round(self.percentile(99), digits),
+            "samples": len(self._samples),
+            "count": self.count,
+        }
+
+
+class LinkQuality:
+    """Round trip times and loss of the pings sent to a satellite.
+
+    Jitter is the smoothed difference between consecutive round trip times,
+    estimated as RFC 3550 does for packet interarrival times.  Loss is the
+    fraction of recent pings that went unanswered.
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """Initialise link quality."""
+        self.rtt = RollingStats(max_samples)
+        self.jitter: float | None = None
+        self.lost = 0
+        self._answered: deque[bool] = deque(maxlen=max_samples)
+        self._ping_sent: float | None = None
+
+    @property
+    def loss(self) -> float | None:
+        """Return the fraction of recent pings that were not answered."""
+        if not self._answered:
+            return None
+        return self._answered.count(False) / len(self._answered)
+
+    def ping_sent(self, now: float) -> None:
+        """Record when a ping was sent."""
+        self._ping_sent = now
+
+    def pong_received(self, now: float) -> float | None:
+        """Record a pong and return the round trip time in milliseconds."""
+        if self._ping_sent is None:
+            # Not an answer to a ping of ours
+            return None
+
+        rtt = (now - self._ping_sent) * 1000
+        self._ping_sent = None
+        if self.rtt.last is not None:
+            difference = abs(rtt - self.rtt.last)
+            if self.jitter is None:
+                self.jitter = difference
+            else:
+                self.jitter += (difference - self.jitter) * _JITTER_GAIN
+        self.rtt.add(rtt)
+        self._answered.append(True)
+        return rtt
+
+    def ping_unanswered(self) -> None:
+        """Count a ping that is still waiting for a pong as lost."""
+        if self._ping_sent is None:
+            return
+        self._ping_sent = None
+        self.lost += 1
+        self._answered.append(False)
+
+    def as_dict(self, digits: int = 1) -> dict[str, Any]:
+        """Return round trip times, jitter, loss and histogram."""
+        loss = self.loss
+        return {
+            **self.rtt.as_dict(digits),
+            "jitter": _round(self.jitter, digits),
+            "loss": round(loss, 3) if loss is not None else None,
+            "lost": self.lost,
+            "histogram": self.rtt.histogram(RTT_HISTOGRAM_BOUNDS),
+        }
+
+
+def _round(value: float | None, digits: int) -> float | None:
+    """Round a value that may be missing."""
+    return round(value, digits) if value is not None else None
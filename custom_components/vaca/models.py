@@ -0,0 +1,22 @@
+"""Models for View Assist Companion App."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.components.wyoming import DomainDataItem
+
+from .cache import AudioCache
+from .pool import WyomingConnectionPool
+
+
+@dataclass
+class VADomainDataItem(DomainDataItem):
+    """Domain data item with VACA specific resources."""
+
+    pool: WyomingConnectionPool | None = None
+    tts_cache: AudioCache | None = None
+
+    # Options the entry was set up with, to tell option changes from moves
+    options: dict[str, Any] = field(default_factory=dict)
@@ -0,0 +1,312 @@
+"""Pool of reusable connections to Wyoming services."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+import logging
+import time
+from typing import Any
+
+from wyoming.client import AsyncTcpClient
+from wyoming.event import Event
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Payload bytes of a request on a reused connection kept to be sent again.
+# Writes to a connection the server closed do not fail, so this covers a
+# whole utterance: 2 MiB is over a minute of 16 kHz 16-bit mono audio.
+_REPLAY_MAX_BYTES = 2 * 1024 * 1024
+
+
+class PooledTcpClient(AsyncTcpClient):
+    """TCP client of a connection pool, retried once when reused.
+
+    Some servers, such as faster-whisper, close the connection after their
+    response, and a connection reused straight away races that close.  On
+    a reused connection, events are kept until the server first answers.
+    If the connection fails before then, the client reconnects and sends
+    them again, so the borrower does not notice.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialise client."""
+        super().__init__(host, port)
+        self._sent: list[Event] | None = None
+        self._sent_bytes = 0
+        self._lock = asyncio.Lock()
+        self._generation = 0
+        self.retried = False
+
+    def start_request(self, reused: bool) -> None:
+        """Start a request, keeping its events if the connection is reused."""
+        self._sent = [] if reused else None
+        self._sent_bytes = 0
+        self.retried = False
+
+    def is_healthy(self) -> bool:
+        """Return True if open and not closed by the server."""
+        return (
+            self._reader is not None
+            and self._writer is not None
+            and not self._writer.is_closing()
+            and not self._reader.at_eof()
+        )
+
+    def close_nowait(self) -> None:
+        """Close the connection without waiting."""
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is not None:
+            writer.close()
+
+    async def write_event(self, event: Event) -> None:
+        """Write an event, retrying on a new connection if allowed."""
+        async with self._lock:
+            if self._sent is not None:
+                self._sent_bytes += len(event.payload or b"")
+                if self._sent_bytes <= _REPLAY_MAX_BYTES:
+                    self._sent.append(event)
+                else:
+                    _LOGGER.debug(
+                        "Request to %s:%s too large to retry", self.host, self.port
+                    )
+                    self._sent = None
+            try:
+                await super().write_event(event)
+            except OSError:
+                if not await self._async_retry():
+                    raise
+
+    async def read_event(self) -> Event | None:
+        """Read an event, retrying on a new connection if allowed."""
+        while True:
+            generation = self._generation
+            try:
+                event = await super().read_event()
+            except OSError:
+                if self._sent is None and generation == self._generation:
+                    raise
+                event = None
+
+            if event is not None:
+                # Server has answered, so the connection is good
+                self._sent = None
+                return event
+
+            async with self._lock:
+                if generation == self._generation and not await self._async_retry():
+                    return None
+
+    async def _async_retry(self) -> bool:
+        """Send the request again on a new connection, holding the lock."""
+        sent, self._sent = self._sent, None
+        if sent is None:
+            return False
+
+        _LOGGER.debug(
+            "Reused connection to %s:%s was closed, retrying", self.host, self.port
+        )
+        with suppress(OSError):
+            await self.disconnect()
+        await self.connect()
+        self._generation += 1
+        self.retried = True
+        for event in sent:
+            await super().write_event(event)
+        return True
+
+
+class WyomingConnectionPool:
+    """Pool of TCP connections to a single Wyoming service.
+
+    Connections are borrowed for the duration of a request and returned to
+    the pool afterwards.  A borrower that leaves a connection in an unknown
+    protocol state should disconnect it, so it is not handed out again.
+    Borrowers wait up to wait_timeout for a connection to be free, so
+    streams open for an unbounded time, such as wake word detection, must
+    not use the pool.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        max_size: int,
+        idle_timeout: float,
+        wait_timeout: float,
+        min_idle: int = 1,
+    ) -> None:
+        """Initialise pool."""
+        self.hass = hass
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.wait_timeout = wait_timeout
+        self.min_idle = min_idle
+
+        self._idle: deque[tuple[PooledTcpClient, float]] = deque()
+        self._slots = asyncio.Semaphore(max_size)
+        self._in_use = 0
+        self._connecting = 0
+        self._closed = False
+        self._tasks: set[asyncio.Task] = set()
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.retried = 0
+        self.borrowed = 0
+        self.wait_timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return pool statistics."""
+        return {
+            "max_size": self.max_size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+            "retried": self.retried,
+            "borrowed": self.borrowed,
+            "wait_timeouts": self.wait_timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 4),
+            "wait_seconds_max": round(self.wait_seconds_max, 4),
+        }
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[AsyncTcpClient]:
+        """Borrow a connection from the pool."""
+        if self._closed:
+            raise ConnectionError("Connection pool is closed")
+
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(self.wait_timeout):
+                await self._slots.acquire()
+        except TimeoutError:
+            self.wait_timeouts += 1
+            raise TimeoutError(
+                f"No connection to {self.host}:{self.port} free "
+                f"after {self.wait_timeout} seconds"
+            ) from None
+
+        try:
+            waited = time.monotonic() - start
+            self.borrowed += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+            client = self._get_idle()
+            if client is None:
+                client = await self._async_connect()
+                client.start_request(reused=False)
+            else:
+                self.reused += 1
+                client.start_request(reused=True)
+
+            self._in_use += 1
+            try:
+                yield client
+            except BaseException:
+                await client.disconnect()
+                raise
+            finally:
+                self._in_use -= 1
+                if client.retried:
+                    self.retried += 1
+                self._release(client)
+        finally:
+            self._slots.release()
+
+    def warm_up(self) -> None:
+        """Open connections in the background so the first request is fast."""
+        needed = self.min_idle - len(self._idle) - self._in_use - self._connecting
+        for _ in range(max(0, needed)):
+            self._connecting += 1
+            task = self.hass.async_create_background_task(
+                self._async_add_idle(), f"wyoming pool connect {self.host}"
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @callback
+    def prune(self) -> None:
+        """Close connections that have been idle too long or are unhealthy."""
+        now = time.monotonic()
+        kept: deque[tuple[PooledTcpClient, float]] = deque()
+        while self._idle:
+            client, last_used = self._idle.popleft()
+            if (now - last_used) < self.idle_timeout and client.is_healthy():
+                kept.append((client, last_used))
+            else:
+                self._discard(client)
+        self._idle = kept
+
+    async def async_close(self) -> None:
+        """Close all idle connections and stop background tasks."""
+        self._closed = True
+        for task in self._tasks:
+            task.cancel()
+        while self._idle:
+            client, _ = self._idle.popleft()
+            await client.disconnect()
+
+    def _get_idle(self) -> PooledTcpClient | None:
+        """Get the most recently used healthy idle connection."""
+        self.prune()
+        if self._idle:
+            client, _ = self._idle.pop()
+            return client
+        return None
+
+    def _release(self, client: PooledTcpClient) -> None:
+        """Return a connection to the pool if it can be used again."""
+        if self._closed or not client.is_healthy():
+            self._discard(client)
+            self.warm_up()
+            return
+
+        self._idle.append((client, time.monotonic()))
+
+    def _discard(self, client: PooledTcpClient) -> None:
+        """Close a connection without waiting."""
+        self.discarded += 1
+        client.close_nowait()
+
+    async def _async_connect(self) -> PooledTcpClient:
+        """Open a new connection."""
+        client = PooledTcpClient(self.host, self.port)
+        await client.connect()
+        self.created += 1
+        _LOGGER.debug("Opened connection to %s:%s", self.host, self.port)
+        return client
+
+    async def _async_add_idle(self) -> None:
+        """Open a connection and add it to the idle list."""
+        try:
+            client = await self._async_connect()
+        except OSError as ex:
+            _LOGGER.debug(
+                "Unable to open connection to %s:%s: %s", self.host, self.port, ex
+            )
+            return
+        finally:
+            self._connecting -= 1
+
+        if self._closed:
+            await client.disconnect()
+            return
+
+        self._idle.append((client, time.monotonic()))
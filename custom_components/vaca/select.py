@@ -17,7 +17,7 @@ from homeassistant.helpers import restore_state
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
-from .devices import SatelliteDevice
+from .devices import SatelliteDevice, VASatelliteDevice
 from .entity import VASatelliteEntity
 
 if TYPE_CHECKING:
@@ -129,22 +129,34 @@ class WyomingSatelliteWakeWordSelect(
     _attr_should_poll = False
     _attr_current_option = "hey_jarvis"
 
+    def __init__(self, device: VASatelliteDevice) -> None:
+        """Initialize entity."""
+        super().__init__(device)
+        # Options are built once per device info revision
+        self._options_revision: int | None = None
+        self._wake_word_options: list[str] = []
+        self._wake_word_models: dict[str, str] = {}
+
     @property
     def options(self) -> list[str]:
         """Return the list of available wake word options."""
-        return self.get_wake_word_options()
-
-    def get_wake_word_options(self) -> list[str]:
-        """Return the list of available wake word options."""
-        wake_options: list[dict[str, str]] = []
+        if self._options_revision != self._device.info_revision:
+            self._options_revision = self._device.info_revision
+            self._wake_word_models = self.get_wake_word_options()
+            self._wake_word_options = list(self._wake_word_models)
+        return self._wake_word_options
+
+    def get_wake_word_options(self) -> dict[str, str]:
+        """Return available wake word options mapped to their model names."""
+        wake_options: dict[str, str] = {}
         if self._device.info:
             if self._device.info.wake:
                 for wake_program in self._device.info.wake:
                     if wake_program.name == "available_wake_words":
-                        wake_options = [
-                            model.name.replace("_", " ").title()
+                        wake_options = {
+                            model.name.replace("_", " ").title(): model.name
                             for model in wake_program.models
-                        ]
+                        }
         return wake_options
 
     async def async_added_to_hass(self) -> None:
@@ -159,7 +171,10 @@ class WyomingSatelliteWakeWordSelect(
         """Select an option."""
         self._attr_current_option = option
         self.async_write_ha_state()
-        self._device.set_custom_setting("wake_word", option.lower().replace(" ", "_"))
+        self._device.set_custom_setting(
+            "wake_word",
+            self._wake_word_models.get(option, option.lower().replace(" ", "_")),
+        )
 
 
 class WyomingSatelliteWakeWordSoundSelect(
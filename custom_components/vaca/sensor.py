@@ -2,28 +2,84 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from datetime import timedelta
 from functools import reduce
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.sensor import RestoreSensor, SensorEntityDescription
-from homeassistant.components.sensor.const import SensorDeviceClass
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorEntity,
+    SensorEntityDescription,
+)
+from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import LIGHT_LUX
+from homeassistant.const import LIGHT_LUX, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-
-from .const import DOMAIN
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+
+from .const import (
+    CONF_INTENT_ATTRIBUTES,
+    CONF_INTENT_ATTRIBUTES_MAX_BYTES,
+    CONF_SENSOR_DEADBAND,
+    CONF_SENSOR_MAX_AGE,
+    CONF_SENSOR_MIN_INTERVAL,
+    CONF_SENSOR_RELATIVE_DEADBAND,
+    DEFAULT_INTENT_ATTRIBUTES,
+    DEFAULT_INTENT_ATTRIBUTES_MAX_BYTES,
+    DEFAULT_SENSOR_DEADBAND,
+    DEFAULT_SENSOR_MAX_AGE,
+    DEFAULT_SENSOR_MIN_INTERVAL,
+    DEFAULT_SENSOR_RELATIVE_DEADBAND,
+    DOMAIN,
+    LATENCY_INTENT,
+    LATENCY_PLAYBACK,
+    LATENCY_RESPONSE,
+    LATENCY_STT,
+    LATENCY_TTS,
+)
+from .devices import VASatelliteDevice
 from .entity import VASatelliteEntity
+from .limiter import StateWriteLimiter
 
 if TYPE_CHECKING:
     from homeassistant.components.wyoming import DomainDataItem
 
 UNKNOWN: str = "unknown"
 
+# Limits of projected intent attribute values
+MAX_ATTRIBUTE_STRING_LENGTH = 255
+MAX_ATTRIBUTE_LIST_ITEMS = 10
+
 _LOGGER = logging.getLogger(__name__)
 
+# Only the link quality sensor is polled, as pings arrive every few seconds
+SCAN_INTERVAL = timedelta(seconds=60)
+
+LATENCY_SENSORS: tuple[SensorEntityDescription, ...] = tuple(
+    SensorEntityDescription(
+        key=stage,
+        translation_key=f"{stage}_latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
+    for stage in (
+        LATENCY_STT,
+        LATENCY_INTENT,
+        LATENCY_TTS,
+        LATENCY_RESPONSE,
+        LATENCY_PLAYBACK,
+    )
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,13 +92,39 @@ async def async_setup_entry(
     # Setup is only forwarded for satellites
     assert item.device is not None
 
+    options = config_entry.options
+
+    def _limiter() -> StateWriteLimiter:
+        return StateWriteLimiter(
+            deadband=options.get(CONF_SENSOR_DEADBAND, DEFAULT_SENSOR_DEADBAND),
+            relative_deadband=options.get(
+                CONF_SENSOR_RELATIVE_DEADBAND, DEFAULT_SENSOR_RELATIVE_DEADBAND
+            ),
+            min_interval=options.get(
+                CONF_SENSOR_MIN_INTERVAL, DEFAULT_SENSOR_MIN_INTERVAL
+            ),
+            max_age=options.get(CONF_SENSOR_MAX_AGE, DEFAULT_SENSOR_MAX_AGE),
+        )
+
     async_add_entities(
         [
             WyomingSatelliteSTTSensor(item.device),
             WyomingSatelliteTTSSensor(item.device),
-            WyomingSatelliteIntentSensor(item.device),
-            WyomingSatelliteLightSensor(item.device),
-            WyomingSatelliteOrientationSensor(item.device),
+            WyomingSatelliteIntentSensor(
+                item.device,
+                options.get(CONF_INTENT_ATTRIBUTES, DEFAULT_INTENT_ATTRIBUTES),
+                options.get(
+                    CONF_INTENT_ATTRIBUTES_MAX_BYTES,
+                    DEFAULT_INTENT_ATTRIBUTES_MAX_BYTES,
+                ),
+            ),
+            WyomingSatelliteLightSensor(item.device, _limiter()),
+            WyomingSatelliteOrientationSensor(item.device, _limiter()),
+            *(
+                WyomingSatelliteLatencySensor(item.device, description)
+                for description in LATENCY_SENSORS
+            ),
+            WyomingSatelliteLinkQualitySensor(item.device),
         ]
     )
 
@@ -114,6 +196,16 @@ class WyomingSatelliteIntentSensor(VASatelliteEntity, RestoreSensor):
         key="intent", translation_key="intent", icon="mdi:message-bulleted"
     )
     _attr_native_value = 0
+    # Conversation ids, targets and results are not worth keeping in history
+    _unrecorded_attributes = frozenset({"intent_output"})
+
+    def __init__(
+        self, device: VASatelliteDevice, attribute_paths: list[str], max_bytes: int
+    ) -> None:
+        """Initialize entity."""
+        super().__init__(device)
+        self._attribute_paths = attribute_paths
+        self._max_bytes = max_bytes
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
@@ -139,9 +231,35 @@ class WyomingSatelliteIntentSensor(VASatelliteEntity, RestoreSensor):
             self._attr_native_value = self.get_key(
                 "intent_output.response.speech.plain.speech", data
             )
-            self._attr_extra_state_attributes = data
+            self._attr_extra_state_attributes = self._compact_attributes(data)
             self.async_write_ha_state()
 
+    def _compact_attributes(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the configured fields of intent data within the size limit.
+
+        Fields are dropped from the end of the configured list until the
+        attributes fit.
+        """
+        paths = list(self._attribute_paths)
+        attributes = project_attributes(data, paths)
+        size = len(json_bytes(attributes))
+        while size > self._max_bytes and paths:
+            paths.pop()
+            attributes = project_attributes(data, paths)
+            size = len(json_bytes(attributes))
+
+        self._device.intent_attribute_stats = {
+            "data_bytes": len(json_bytes(data)),
+            "attribute_bytes": size,
+            "dropped_fields": len(self._attribute_paths) - len(paths),
+        }
+        _LOGGER.debug(
+            "Intent attributes reduced to %s bytes: %s",
+            size,
+            self._device.intent_attribute_stats,
+        )
+        return attributes
+
     def get_key(
         self, dot_notation_path: str, data: dict
     ) -> dict[str, dict | str | int] | str | int:
@@ -157,16 +275,62 @@ class WyomingSatelliteIntentSensor(VASatelliteEntity, RestoreSensor):
             return None
 
 
-class WyomingSatelliteLightSensor(VASatelliteEntity, RestoreSensor):
-    """Entity to represent light sensor for satellite."""
-
-    entity_description = SensorEntityDescription(
-        key="light",
-        translation_key="light_level",
-        device_class=SensorDeviceClass.ILLUMINANCE,
-        native_unit_of_measurement=LIGHT_LUX,
-    )
-    _attr_native_value = 0
+def project_attributes(data: dict[str, Any], paths: list[str]) -> dict[str, Any]:
+    """Copy the values at dot notation paths of data into a new nested dict.
+
+    Long strings and lists are shortened.
+    """
+    result: dict[str, Any] = {}
+    for path in paths:
+        keys = path.split(".")
+        value: Any = data
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = result
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+                if not isinstance(target, dict):
+                    # Already copied as a whole by a shorter path
+                    break
+            else:
+                target[keys[-1]] = _limit_value(value)
+    return result
+
+
+def _limit_value(value: Any) -> Any:
+    """Shorten long strings and lists, including those nested in value."""
+    if isinstance(value, str):
+        if len(value) > MAX_ATTRIBUTE_STRING_LENGTH:
+            return value[: MAX_ATTRIBUTE_STRING_LENGTH - 2] + ".."
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_limit_value(item) for item in value[:MAX_ATTRIBUTE_LIST_ITEMS]]
+    if isinstance(value, dict):
+        return {key: _limit_value(item) for key, item in value.items()}
+    return value
+
+
+class WyomingSatelliteStatusSensor(VASatelliteEntity, RestoreSensor):
+    """Base entity for a sensor reported in satellite custom status.
+
+    Status updates can arrive many times a second, so state writes go
+    through a StateWriteLimiter.  A change held back by the minimum interval
+    is written when the interval has passed, so the last value is not lost.
+    A change held back by the deadband is written once max_age has passed,
+    as repeats of the same value are not passed on by the status router.
+    """
+
+    def __init__(self, device: VASatelliteDevice, limiter: StateWriteLimiter) -> None:
+        """Initialize entity."""
+        super().__init__(device)
+        self._limiter = limiter
+        self._pending_value: Any = None
+        self._pending_at: float | None = None
+        self._cancel_pending: Callable[[], None] | None = None
+        device.state_write_limiters[self.entity_description.key] = limiter
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
@@ -178,23 +342,84 @@ class WyomingSatelliteLightSensor(VASatelliteEntity, RestoreSensor):
             self.async_write_ha_state()
 
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{DOMAIN}_{self._device.device_id}_status_update",
-                self.status_update,
+            self._device.status_router.async_register(
+                self.entity_description.key, self.status_update
             )
         )
+        self.async_on_remove(self._cancel_pending_write)
+
+    def _convert(self, value: Any) -> Any:
+        """Convert a reported value to the native value."""
+        return value
 
     @callback
-    def status_update(self, data: dict[str, Any]) -> None:
+    def status_update(self, value: Any) -> None:
         """Update entity."""
-        if sensors := data.get("sensors"):
-            if self.entity_description.key in sensors:
-                self._attr_native_value = int(sensors[self.entity_description.key])
-                self.async_write_ha_state()
+        self._write_limited(self._convert(value))
 
+    @callback
+    def _write_limited(self, value: Any) -> None:
+        """Write value if the limiter allows, else hold it back."""
+        now = time.monotonic()
+        if self._limiter.should_write(value, now):
+            self._cancel_pending_write()
+            self._attr_native_value = value
+            self.async_write_ha_state()
+            return
+
+        # Written when the minimum interval or max age has passed, unless a
+        # newer value is written first
+        if self._limiter.held_back:
+            write_at = self._limiter.next_write()
+        elif self._limiter.drifted:
+            write_at = self._limiter.next_heartbeat()
+        else:
+            write_at = None
+
+        if write_at is None:
+            # Back to the written value, or drift within the deadband allowed
+            self._cancel_pending_write()
+            return
+
+        self._pending_value = value
+        if self._cancel_pending is None or write_at != self._pending_at:
+            self._cancel_pending_write()
+            self._pending_at = write_at
+            self._cancel_pending = async_call_later(
+                self.hass, max(0, write_at - now), self._write_pending
+            )
+
+    @callback
+    def _write_pending(self, _now: Any) -> None:
+        """Write the value held back by the minimum interval."""
+        self._cancel_pending = None
+        self._write_limited(self._pending_value)
+
+    @callback
+    def _cancel_pending_write(self) -> None:
+        """Cancel a pending write."""
+        if self._cancel_pending is not None:
+            self._cancel_pending()
+            self._cancel_pending = None
 
-class WyomingSatelliteOrientationSensor(VASatelliteEntity, RestoreSensor):
+
+class WyomingSatelliteLightSensor(WyomingSatelliteStatusSensor):
+    """Entity to represent light sensor for satellite."""
+
+    entity_description = SensorEntityDescription(
+        key="light",
+        translation_key="light_level",
+        device_class=SensorDeviceClass.ILLUMINANCE,
+        native_unit_of_measurement=LIGHT_LUX,
+    )
+    _attr_native_value = 0
+
+    def _convert(self, value: Any) -> int:
+        """Convert a reported value to the native value."""
+        return int(value)
+
+
+class WyomingSatelliteOrientationSensor(WyomingSatelliteStatusSensor):
     """Entity to represent orientation sensor for satellite."""
 
     entity_description = SensorEntityDescription(
@@ -203,27 +428,65 @@ class WyomingSatelliteOrientationSensor(VASatelliteEntity, RestoreSensor):
     )
     _attr_native_value = UNKNOWN
 
+
+class WyomingSatelliteLatencySensor(VASatelliteEntity, SensorEntity):
+    """Entity to represent a voice pipeline stage latency for satellite."""
+
+    def __init__(
+        self, device: VASatelliteDevice, description: SensorEntityDescription
+    ) -> None:
+        """Initialize entity."""
+        self.entity_description = description
+        super().__init__(device)
+        # Keep unique ids distinct from the stt and tts text sensors
+        self._attr_unique_id = f"{device.satellite_id}-{description.key}_latency"
+
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
         await super().async_added_to_hass()
 
-        state = await self.async_get_last_state()
-        if state is not None:
-            self._attr_native_value = state.state
-            self.async_write_ha_state()
-
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{DOMAIN}_{self._device.device_id}_status_update",
-                self.status_update,
+                f"{DOMAIN}_{self._device.device_id}_latency",
+                self.latency_update,
             )
         )
 
     @callback
-    def status_update(self, data: dict[str, Any]) -> None:
+    def latency_update(self, stage: str) -> None:
+        """Update entity."""
+        if stage != self.entity_description.key:
+            return
+
+        stats = self._device.latency[stage]
+        self._attr_native_value = stats.last
+        self._attr_extra_state_attributes = stats.as_dict()
+        self.async_write_ha_state()
+
+
+class WyomingSatelliteLinkQualitySensor(VASatelliteEntity, SensorEntity):
+    """Entity to represent ping round trip time to satellite.
+
+    The state is the median of recent round trip times, with jitter, loss
+    and a histogram as attributes.  Pongs arrive every few seconds, so the
+    entity is polled instead of written on each one.
+    """
+
+    entity_description = SensorEntityDescription(
+        key="link_quality",
+        translation_key="link_quality",
+        icon="mdi:wifi",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    )
+    _attr_should_poll = True
+
+    async def async_update(self) -> None:
         """Update entity."""
-        if sensors := data.get("sensors"):
-            if self.entity_description.key in sensors:
-                self._attr_native_value = sensors[self.entity_description.key]
-                self.async_write_ha_state()
+        link_quality = self._device.link_quality
+        median = link_quality.rtt.percentile(50)
+        self._attr_native_value = round(median, 1) if median is not None else None
+        self._attr_extra_state_attributes = link_quality.as_dict()
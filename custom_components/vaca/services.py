@@ -0,0 +1,112 @@
+"""Services for View Assist Companion App."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+# pylint: disable-next=hass-component-root-import
+from homeassistant.components.assist_satellite.const import PREANNOUNCE_URL
+from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .broadcast import async_broadcast
+from .const import DEFAULT_BROADCAST_TIMEOUT, DOMAIN, SERVICE_BROADCAST
+from .hub import async_get_hub
+
+ATTR_MESSAGE = "message"
+ATTR_MEDIA_ID = "media_id"
+ATTR_PREANNOUNCE = "preannounce"
+ATTR_PREANNOUNCE_MEDIA_ID = "preannounce_media_id"
+ATTR_TIMEOUT = "timeout"
+
+# Accepts a plain string or the media selector format, as assist_satellite does
+_MEDIA_ID_VALIDATOR = vol.Any(
+    cv.string,
+    vol.All(
+        vol.Schema(
+            {
+                vol.Required("media_content_id"): cv.string,
+                vol.Required("media_content_type"): cv.string,
+                vol.Remove("metadata"): dict,
+            }
+        ),
+        lambda value: value["media_content_id"],
+    ),
+)
+
+BROADCAST_SCHEMA = vol.All(
+    cv.make_entity_service_schema(
+        {
+            vol.Optional(ATTR_MESSAGE): cv.string,
+            vol.Optional(ATTR_MEDIA_ID): _MEDIA_ID_VALIDATOR,
+            vol.Optional(ATTR_PREANNOUNCE, default=True): cv.boolean,
+            vol.Optional(ATTR_PREANNOUNCE_MEDIA_ID): _MEDIA_ID_VALIDATOR,
+            vol.Optional(ATTR_TIMEOUT, default=DEFAULT_BROADCAST_TIMEOUT): vol.All(
+                vol.Coerce(float), vol.Range(min=1)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_MESSAGE, ATTR_MEDIA_ID),
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    async def _async_broadcast(call: ServiceCall) -> ServiceResponse:
+        """Play an announcement on several satellites at once."""
+        announcers = async_get_hub(hass).announcers
+        if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL:
+            entity_ids = list(announcers)
+        else:
+            # Targets may be areas, devices, floors or labels, which can
+            # include other entities, so only named entities must be satellites
+            selected = async_extract_referenced_entity_ids(hass, call)
+            if unknown := sorted(selected.referenced - announcers.keys()):
+                raise ServiceValidationError(
+                    f"Not View Assist satellites: {', '.join(unknown)}"
+                )
+            targeted = selected.referenced | selected.indirectly_referenced
+            entity_ids = [
+                entity_id for entity_id in announcers if entity_id in targeted
+            ]
+
+        if not entity_ids:
+            raise ServiceValidationError("No View Assist satellites targeted")
+
+        preannounce_media_id: str | None = None
+        if call.data[ATTR_PREANNOUNCE]:
+            preannounce_media_id = call.data.get(
+                ATTR_PREANNOUNCE_MEDIA_ID, PREANNOUNCE_URL
+            )
+
+        results = await async_broadcast(
+            hass,
+            [announcers[entity_id] for entity_id in entity_ids],
+            call.data.get(ATTR_MESSAGE, ""),
+            call.data.get(ATTR_MEDIA_ID),
+            preannounce_media_id,
+            call.data[ATTR_TIMEOUT],
+        )
+        response: dict[str, Any] = {"results": results}
+        return response
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BROADCAST,
+        _async_broadcast,
+        schema=BROADCAST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
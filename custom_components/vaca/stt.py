@@ -3,18 +3,37 @@
 from collections.abc import AsyncIterable
 import logging
 
-from wyoming.asr import Transcribe, Transcript
+from wyoming.asr import (
+    Transcribe,
+    Transcript,
+    TranscriptChunk,
+    TranscriptStart,
+    TranscriptStop,
+)
 from wyoming.audio import AudioChunk, AudioStart, AudioStop
 from wyoming.client import AsyncTcpClient
 
 from homeassistant.components import stt
-from homeassistant.components.wyoming import DomainDataItem, WyomingService
+from homeassistant.components.wyoming import WyomingService
+
+# pylint: disable-next=hass-component-root-import
+from homeassistant.components.wyoming.error import WyomingError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import DOMAIN, SAMPLE_CHANNELS, SAMPLE_RATE, SAMPLE_WIDTH
-from .error import WyomingError
+from .audio import async_aggregate_audio
+from .const import (
+    CONF_STT_FRAME_MS,
+    DEFAULT_STT_FRAME_MS,
+    DOMAIN,
+    SAMPLE_CHANNELS,
+    SAMPLE_RATE,
+    SAMPLE_WIDTH,
+)
+from .models import VADomainDataItem
+from .pool import WyomingConnectionPool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,10 +44,11 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Wyoming speech-to-text."""
-    item: DomainDataItem = hass.data[DOMAIN][config_entry.entry_id]
+    item: VADomainDataItem = hass.data[DOMAIN][config_entry.entry_id]
+    assert item.pool is not None
     async_add_entities(
         [
-            WyomingSttProvider(config_entry, item.service),
+            WyomingSttProvider(config_entry, item.service, item.pool),
         ]
     )
 
@@ -40,9 +60,11 @@ class WyomingSttProvider(stt.SpeechToTextEntity):
         self,
         config_entry: ConfigEntry,
         service: WyomingService,
+        pool: WyomingConnectionPool,
     ) -> None:
         """Set up provider."""
         self.service = service
+        self._pool = pool
         asr_service = service.info.asr[0]
 
         model_languages: set[str] = set()
@@ -51,9 +73,17 @@ class WyomingSttProvider(stt.SpeechToTextEntity):
                 model_languages.update(asr_model.languages)
 
         self._supported_languages = list(model_languages)
+        frame_ms = config_entry.options.get(CONF_STT_FRAME_MS, DEFAULT_STT_FRAME_MS)
+        self._frame_bytes = (
+            int(SAMPLE_RATE * frame_ms / 1000) * SAMPLE_WIDTH * SAMPLE_CHANNELS
+        )
         self._attr_name = asr_service.name
         self._attr_unique_id = f"{config_entry.entry_id}-stt"
 
+        # Partial transcripts can only be matched to a satellite by the
+        # engine, so they are only sent when one stream is in progress
+        self._active_streams = 0
+
     @property
     def supported_languages(self) -> list[str]:
         """Return a list of supported languages."""
@@ -88,8 +118,9 @@ class WyomingSttProvider(stt.SpeechToTextEntity):
         self, metadata: stt.SpeechMetadata, stream: AsyncIterable[bytes]
     ) -> stt.SpeechResult:
         """Process an audio stream to STT service."""
+        self._active_streams += 1
         try:
-            async with AsyncTcpClient(self.service.host, self.service.port) as client:
+            async with self._pool.connection() as client:
                 # Set transcription language
                 await client.write_event(Transcribe(language=metadata.language).event())
 
@@ -102,34 +133,79 @@ class WyomingSttProvider(stt.SpeechToTextEntity):
                     ).event(),
                 )
 
-                async for audio_bytes in stream:
-                    chunk = AudioChunk(
-                        rate=SAMPLE_RATE,
-                        width=SAMPLE_WIDTH,
-                        channels=SAMPLE_CHANNELS,
-                        audio=audio_bytes,
-                    )
-                    await client.write_event(chunk.event())
-
-                # End audio stream
-                await client.write_event(AudioStop().event())
-
-                while True:
-                    event = await client.read_event()
-                    if event is None:
-                        _LOGGER.debug("Connection lost")
-                        return stt.SpeechResult(None, stt.SpeechResultState.ERROR)
-
-                    if Transcript.is_type(event.type):
-                        transcript = Transcript.from_event(event)
-                        text = transcript.text
-                        break
+                # Read while audio is sent, as streaming servers send
+                # transcript chunks while the user is still talking
+                read_task = self.hass.async_create_task(
+                    self._async_read_transcript(client)
+                )
+                try:
+                    async for audio_bytes in async_aggregate_audio(
+                        stream, self._frame_bytes
+                    ):
+                        chunk = AudioChunk(
+                            rate=SAMPLE_RATE,
+                            width=SAMPLE_WIDTH,
+                            channels=SAMPLE_CHANNELS,
+                            audio=audio_bytes,
+                        )
+                        await client.write_event(chunk.event())
+
+                    # End audio stream
+                    await client.write_event(AudioStop().event())
+                except BaseException:
+                    read_task.cancel()
+                    raise
+
+                text = await read_task
+                if text is None:
+                    _LOGGER.debug("Connection lost")
+                    await client.disconnect()
+                    return stt.SpeechResult(None, stt.SpeechResultState.ERROR)
 
         except (OSError, WyomingError):
             _LOGGER.exception("Error processing audio stream")
             return stt.SpeechResult(None, stt.SpeechResultState.ERROR)
+        finally:
+            self._active_streams -= 1
 
         return stt.SpeechResult(
             text,
             stt.SpeechResultState.SUCCESS,
         )
+
+    async def _async_read_transcript(self, client: AsyncTcpClient) -> str | None:
+        """Read events until the final transcript, passing on partial ones.
+
+        Streaming servers end with transcript-stop after the transcript, which
+        is read too so the connection is returned to the pool with nothing
+        left unread.
+        """
+        partial = ""
+        streaming = False
+        text: str | None = None
+        while True:
+            event = await client.read_event()
+            if event is None:
+                # Connection is not healthy so is not reused
+                return text
+
+            if Transcript.is_type(event.type):
+                text = Transcript.from_event(event).text
+                if not streaming:
+                    return text
+            elif TranscriptStop.is_type(event.type):
+                if text is not None:
+                    return text
+            elif TranscriptStart.is_type(event.type):
+                streaming = True
+                partial = ""
+            elif TranscriptChunk.is_type(event.type):
+                partial += TranscriptChunk.from_event(event).text
+                self._send_partial_transcript(partial)
+
+    def _send_partial_transcript(self, text: str) -> None:
+        """Send the transcript so far to the satellite running this engine."""
+        if self._active_streams == 1 and self.entity_id:
+            async_dispatcher_send(
+                self.hass, f"{DOMAIN}_{self.entity_id}_transcript_chunk", text
+            )
@@ -6,17 +6,29 @@ import logging
 import wave
 
 from wyoming.audio import AudioChunk, AudioStop
-from wyoming.client import AsyncTcpClient
 from wyoming.tts import Synthesize, SynthesizeVoice
 
 from homeassistant.components import tts
-from homeassistant.components.wyoming import DomainDataItem, WyomingService
+from homeassistant.components.wyoming import WyomingService
+
+# pylint: disable-next=hass-component-root-import
+from homeassistant.components.wyoming.error import WyomingError
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .const import ATTR_SPEAKER, DOMAIN
-from .error import WyomingError
+from .cache import AudioCache
+from .const import (
+    ATTR_SPEAKER,
+    CONF_TTS_CACHE_DISK_MAX_BYTES,
+    CONF_TTS_CACHE_MAX_BYTES,
+    DEFAULT_TTS_CACHE_DISK_MAX_BYTES,
+    DEFAULT_TTS_CACHE_MAX_BYTES,
+    DOMAIN,
+    TTS_CACHE_DIR,
+)
+from .models import VADomainDataItem
+from .pool import WyomingConnectionPool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,10 +39,22 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Wyoming speech-to-text."""
-    item: DomainDataItem = hass.data[DOMAIN][config_entry.entry_id]
+    item: VADomainDataItem = hass.data[DOMAIN][config_entry.entry_id]
+    item.tts_cache = AudioCache(
+        hass,
+        "tts",
+        max_bytes=config_entry.options.get(
+            CONF_TTS_CACHE_MAX_BYTES, DEFAULT_TTS_CACHE_MAX_BYTES
+        ),
+        disk_path=hass.config.path(TTS_CACHE_DIR, config_entry.entry_id),
+        max_disk_bytes=config_entry.options.get(
+            CONF_TTS_CACHE_DISK_MAX_BYTES, DEFAULT_TTS_CACHE_DISK_MAX_BYTES
+        ),
+    )
+    assert item.pool is not None
     async_add_entities(
         [
-            WyomingTtsProvider(config_entry, item.service),
+            WyomingTtsProvider(config_entry, item.service, item.pool, item.tts_cache),
         ]
     )
 
@@ -42,9 +66,13 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
         self,
         config_entry: ConfigEntry,
         service: WyomingService,
+        pool: WyomingConnectionPool,
+        cache: AudioCache,
     ) -> None:
         """Set up provider."""
         self.service = service
+        self._pool = pool
+        self._cache = cache
         self._tts_service = next(tts for tts in service.info.tts if tts.installed)
 
         voice_languages: set[str] = set()
@@ -110,8 +138,14 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
         voice_name: str | None = options.get(tts.ATTR_VOICE)
         voice_speaker: str | None = options.get(ATTR_SPEAKER)
 
+        # Most responses repeat so avoid synthesizing them again
+        cache_key = (message, language, voice_name, voice_speaker)
+        if (data := await self._cache.async_get(cache_key)) is not None:
+            _LOGGER.debug("TTS cache hit: %s", self._cache.stats)
+            return ("wav", data)
+
         try:
-            async with AsyncTcpClient(self.service.host, self.service.port) as client:
+            async with self._pool.connection() as client:
                 voice: SynthesizeVoice | None = None
                 if voice_name is not None:
                     voice = SynthesizeVoice(name=voice_name, speaker=voice_speaker)
@@ -125,6 +159,7 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
                         event = await client.read_event()
                         if event is None:
                             _LOGGER.debug("Connection lost")
+                            await client.disconnect()
                             return (None, None)
 
                         if AudioStop.is_type(event.type):
@@ -148,4 +183,8 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
         except (OSError, WyomingError):
             return (None, None)
 
+        if wav_writer is not None:
+            await self._cache.async_set(cache_key, data)
+            _LOGGER.debug("TTS cache miss: %s", self._cache.stats)
+
         return ("wav", data)
@@ -1,15 +1,18 @@
 """Support for Wyoming wake-word-detection services."""
 
 import asyncio
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, Iterable
+from contextlib import suppress
 import logging
+import time
 
 from wyoming.audio import AudioChunk, AudioStart
 from wyoming.client import AsyncTcpClient
+from wyoming.info import WakeModel
 from wyoming.wake import Detect, Detection
 
 from homeassistant.components import wake_word
-from homeassistant.components.wyoming import DomainDataItem, WyomingService
+from homeassistant.components.wyoming import WyomingService
 
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.wyoming.data import load_wyoming_info
@@ -21,9 +24,16 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
+from .models import VADomainDataItem
 
 _LOGGER = logging.getLogger(__name__)
 
+# Audio read from the pipeline but not yet sent to the wake service
+_AUDIO_QUEUE_CHUNKS = 8
+
+# Supported wake words older than this are refreshed in the background
+_WAKE_WORDS_TTL = 300
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,7 +41,7 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Wyoming wake-word-detection."""
-    item: DomainDataItem = hass.data[DOMAIN][config_entry.entry_id]
+    item: VADomainDataItem = hass.data[DOMAIN][config_entry.entry_id]
     async_add_entities(
         [
             WyomingWakeWordProvider(hass, config_entry, item.service),
@@ -53,34 +63,75 @@ class WyomingWakeWordProvider(wake_word.WakeWordDetectionEntity):
         self.service = service
         wake_service = service.info.wake[0]
 
-        self._supported_wake_words = [
-            wake_word.WakeWord(
-                id=ww.name, name=ww.description or ww.name, phrase=ww.phrase
-            )
-            for ww in wake_service.models
-        ]
+        self._supported_wake_words: list[wake_word.WakeWord] = []
+        self._phrases: dict[str, str] = {}
+        self._wake_word_ids: set[str] = set()
+        self._wake_words_updated: float | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._set_wake_words(wake_service.models)
+
         self._attr_name = wake_service.name
         self._attr_unique_id = f"{config_entry.entry_id}-wake_word"
 
     async def get_supported_wake_words(self) -> list[wake_word.WakeWord]:
-        """Return a list of supported wake words."""
-        info = await load_wyoming_info(
-            self.service.host, self.service.port, retries=0, timeout=1
-        )
+        """Return a list of supported wake words.
 
-        if info is not None:
-            wake_service = info.wake[0]
-            self._supported_wake_words = [
-                wake_word.WakeWord(
-                    id=ww.name,
-                    name=ww.description or ww.name,
-                    phrase=ww.phrase,
-                )
-                for ww in wake_service.models
-            ]
+        Cached wake words are returned straight away.  Once they are older
+        than the TTL, or the service may have restarted with other models,
+        they are refreshed from the service in the background.
+        """
+        if (
+            self._wake_words_updated is None
+            or time.monotonic() - self._wake_words_updated >= _WAKE_WORDS_TTL
+        ) and self._refresh_task is None:
+            self._refresh_task = self.hass.async_create_background_task(
+                self._async_refresh_wake_words(), "wyoming wake words refresh"
+            )
 
         return self._supported_wake_words
 
+    async def _async_refresh_wake_words(self) -> None:
+        """Load supported wake words from the service."""
+        try:
+            info = await load_wyoming_info(
+                self.service.host, self.service.port, retries=0, timeout=1
+            )
+            if info is not None and info.wake:
+                self._set_wake_words(info.wake[0].models)
+            else:
+                # Keep the stale list, and try again after the TTL
+                self._wake_words_updated = time.monotonic()
+        finally:
+            self._refresh_task = None
+
+    def _create_client(self) -> AsyncTcpClient:
+        """Create a client for one stream.
+
+        Streams last as long as a pipeline waits for the wake word, so they
+        have their own connection rather than holding one of the pool.
+        """
+        return AsyncTcpClient(self.service.host, self.service.port)
+
+    def _invalidate_wake_words(self) -> None:
+        """Refresh wake words when next asked for them."""
+        self._wake_words_updated = None
+
+    def _set_wake_words(self, models: Iterable[WakeModel]) -> None:
+        """Set supported wake words and their phrases."""
+        self._supported_wake_words = [
+            wake_word.WakeWord(
+                id=ww.name,
+                name=ww.description or ww.name,
+                phrase=ww.phrase,
+            )
+            for ww in models
+        ]
+        self._phrases = {
+            ww.id: ww.phrase for ww in self._supported_wake_words if ww.phrase
+        }
+        self._wake_word_ids = {ww.id for ww in self._supported_wake_words}
+        self._wake_words_updated = time.monotonic()
+
     async def _async_process_audio_stream(
         self, stream: AsyncIterable[tuple[bytes, int]], wake_word_id: str | None
     ) -> wake_word.DetectionResult | None:
@@ -89,14 +140,66 @@ class WyomingWakeWordProvider(wake_word.WakeWordDetectionEntity):
         Audio must be 16Khz sample rate with 16-bit mono PCM samples.
         """
 
-        async def next_chunk():
-            """Get the next chunk from audio stream."""
-            async for chunk_bytes in stream:
-                return chunk_bytes
-            return None
+        queue: asyncio.Queue[tuple[bytes, int] | None] = asyncio.Queue(
+            maxsize=_AUDIO_QUEUE_CHUNKS
+        )
+        stop_reading = False
+        stream_ended = False
+
+        async def read_audio() -> None:
+            """Queue audio from the stream until stopped or the stream ends."""
+            try:
+                async for chunk_info in stream:
+                    await queue.put(chunk_info)
+                    if stop_reading:
+                        break
+            finally:
+                await queue.put(None)
+
+        async def forward_audio(client: AsyncTcpClient) -> None:
+            """Send queued audio to the wake service until the stream ends."""
+            nonlocal stream_ended
+            while (chunk_info := await queue.get()) is not None:
+                chunk_bytes, chunk_timestamp = chunk_info
+                chunk = AudioChunk(
+                    rate=16000,
+                    width=2,
+                    channels=1,
+                    audio=chunk_bytes,
+                    timestamp=chunk_timestamp,
+                )
+                await client.write_event(chunk.event())
+            stream_ended = True
+
+        async def read_events(client: AsyncTcpClient) -> Detection | None:
+            """Read events until the wake word is detected or connection lost."""
+            while True:
+                event = await client.read_event()
+                if event is None:
+                    _LOGGER.debug("Connection lost")
+                    return None
+
+                if Detection.is_type(event.type):
+                    # Possible detection
+                    detection = Detection.from_event(event)
+                    _LOGGER.info(detection)
+
+                    if detection.name and detection.name not in self._wake_word_ids:
+                        # Service has a model we do not know about
+                        self._invalidate_wake_words()
+
+                    if wake_word_id and (detection.name != wake_word_id):
+                        _LOGGER.warning(
+                            "Expected wake word %s but got %s, skipping",
+                            wake_word_id,
+                            detection.name,
+                        )
+                        continue
+
+                    return detection
 
         try:
-            async with AsyncTcpClient(self.service.host, self.service.port) as client:
+            async with self._create_client() as client:
                 # Inform client which wake word we want to detect (None = default)
                 await client.write_event(
                     Detect(names=[wake_word_id] if wake_word_id else None).event()
@@ -110,102 +213,63 @@ class WyomingWakeWordProvider(wake_word.WakeWordDetectionEntity):
                     ).event(),
                 )
 
-                # Read audio and wake events in "parallel"
-                audio_task = asyncio.create_task(next_chunk())
-                wake_task = asyncio.create_task(client.read_event())
-                pending = {audio_task, wake_task}
+                # Read audio and wake events in "parallel", and stop
+                # forwarding audio as soon as the wake word is detected
+                audio_task = asyncio.create_task(read_audio())
+                wake_task = asyncio.create_task(read_events(client))
+                forward_task = asyncio.create_task(forward_audio(client))
 
                 try:
-                    while True:
-                        done, pending = await asyncio.wait(
-                            pending, return_when=asyncio.FIRST_COMPLETED
+                    await asyncio.wait(
+                        (forward_task, wake_task), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not wake_task.done():
+                        # Stream ended, or sending audio failed
+                        forward_task.result()
+                    elif detection := wake_task.result():
+                        forward_task.cancel()
+                        with suppress(asyncio.CancelledError):
+                            await forward_task
+
+                        # Retrieve queued audio
+                        stop_reading = True
+                        queued_audio: list[tuple[bytes, int]] = []
+                        while not stream_ended:
+                            if (chunk_info := await queue.get()) is None:
+                                stream_ended = True
+                            else:
+                                queued_audio.append(chunk_info)
+
+                        return wake_word.DetectionResult(
+                            wake_word_id=detection.name or "",
+                            wake_word_phrase=self._get_phrase(detection.name or ""),
+                            timestamp=detection.timestamp,
+                            queued_audio=queued_audio or None,
                         )
-
-                        if wake_task in done:
-                            event = wake_task.result()
-                            if event is None:
-                                _LOGGER.debug("Connection lost")
-                                break
-
-                            if Detection.is_type(event.type):
-                                # Possible detection
-                                detection = Detection.from_event(event)
-                                _LOGGER.info(detection)
-
-                                if wake_word_id and (detection.name != wake_word_id):
-                                    _LOGGER.warning(
-                                        "Expected wake word %s but got %s, skipping",
-                                        wake_word_id,
-                                        detection.name,
-                                    )
-                                    wake_task = asyncio.create_task(client.read_event())
-                                    pending.add(wake_task)
-                                    continue
-
-                                # Retrieve queued audio
-                                queued_audio: list[tuple[bytes, int]] | None = None
-                                if audio_task in pending:
-                                    # Save queued audio
-                                    await audio_task
-                                    pending.remove(audio_task)
-                                    queued_audio = [audio_task.result()]
-
-                                return wake_word.DetectionResult(
-                                    wake_word_id=detection.name or "",
-                                    wake_word_phrase=self._get_phrase(
-                                        detection.name or ""
-                                    ),
-                                    timestamp=detection.timestamp,
-                                    queued_audio=queued_audio,
-                                )
-
-                            # Next event
-                            wake_task = asyncio.create_task(client.read_event())
-                            pending.add(wake_task)
-
-                        if audio_task in done:
-                            # Forward audio to wake service
-                            chunk_info = audio_task.result()
-                            if chunk_info is None:
-                                break
-
-                            chunk_bytes, chunk_timestamp = chunk_info
-                            chunk = AudioChunk(
-                                rate=16000,
-                                width=2,
-                                channels=1,
-                                audio=chunk_bytes,
-                                timestamp=chunk_timestamp,
-                            )
-                            await client.write_event(chunk.event())
-
-                            # Next chunk
-                            audio_task = asyncio.create_task(next_chunk())
-                            pending.add(audio_task)
                 finally:
                     # Clean up
-                    if audio_task in pending:
-                        # It's critical that we don't cancel the audio task or
-                        # leave it hanging. This would mess up the pipeline STT
-                        # by stopping the audio stream.
-                        await audio_task
-                        pending.remove(audio_task)
-
-                    for task in pending:
-                        task.cancel()
+                    forward_task.cancel()
+                    wake_task.cancel()
+                    with suppress(asyncio.CancelledError, OSError):
+                        await forward_task
+                    with suppress(asyncio.CancelledError, OSError):
+                        await wake_task
+
+                    # It's critical that we don't cancel the audio task or
+                    # leave it hanging. This would mess up the pipeline STT
+                    # by stopping the audio stream.
+                    stop_reading = True
+                    while not stream_ended:
+                        stream_ended = await queue.get() is None
+                    await audio_task
 
         except (OSError, WyomingError):
             _LOGGER.exception("Error processing audio stream")
+            # Service may be restarting, perhaps with other models
+            self._invalidate_wake_words()
 
         return None
 
     def _get_phrase(self, model_id: str) -> str:
         """Get wake word phrase for model id."""
-        for ww_model in self._supported_wake_words:
-            if not ww_model.phrase:
-                continue
-
-            if ww_model.id == model_id:
-                return ww_model.phrase
-
-        return model_id
+        return self._phrases.get(model_id, model_id)